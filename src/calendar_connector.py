@@ -39,6 +39,9 @@ except ImportError:
 
 CALENDAR_OPEN_DELAY_SECONDS = 2.0
 
+# Environment fallback used when no calendar preference is passed in
+_USE_GOOGLE_CALENDAR = os.environ.get('USE_GOOGLE_CALENDAR', '').lower() in ('1', 'true', 'yes')
+
 
 def _tzinfo_to_iana(tzinfo) -> Optional[str]:
     """
@@ -264,7 +267,7 @@ def _open_google_calendar_async(url: str):
     """
     import src.notifications as _notif_mod
     
-    if _notif_mod._SHUTTING_DOWN:
+    if _notif_mod._SHUTDOWN_EVENT.is_set():
         Log.info("[CRASH-TEST] Shutting down - aborting Google Calendar opener thread.")
         return
     
@@ -284,13 +287,13 @@ def _open_google_calendar_async(url: str):
             )
             time.sleep(CALENDAR_OPEN_DELAY_SECONDS)
 
-        if _notif_mod._SHUTTING_DOWN:
+        if _notif_mod._SHUTDOWN_EVENT.is_set():
             Log.info("[CRASH-TEST] Shutting down before Google Calendar open - aborting")
             return
 
         subprocess.run(['open', url], check=True)
         Log.info(f"Opened Google Calendar URL in browser: {url[:100]}...")
-        Log.kv({"stage": "calendar", "action": "google_calendar_url_opened", "url": url})
+        Log.kv(stage="calendar", action="google_calendar_url_opened", url=url)
         
         # Brief wait to ensure everything settles
         time.sleep(0.2)
@@ -452,7 +455,7 @@ def _show_eventkit_dialog(normalized_event) -> bool:
             
             if process.returncode == 0:
                 Log.info("EventKit dialog shown via Calendar app")
-                Log.kv({"stage": "calendar", "action": "eventkit_dialog_shown"})
+                Log.kv(stage="calendar", action="eventkit_dialog_shown")
                 return True
             else:
                 Log.warn(f"Failed to open Calendar event: {stderr.decode()}")
@@ -463,7 +466,7 @@ def _show_eventkit_dialog(normalized_event) -> bool:
         
     except Exception as e:
         Log.error(f"EventKit dialog failed: {e}")
-        Log.kv({"stage": "calendar", "action": "eventkit_failed", "error": str(e)})
+        Log.kv(stage="calendar", action="eventkit_failed", error=str(e))
         return False
 
 
@@ -532,18 +535,18 @@ def _generate_ics(normalized_event) -> Optional[Path]:
         ics_path.write_text(ics_content, encoding='utf-8')
         
         Log.info(f"ICS file generated: {ics_path}")
-        Log.kv({
-            "stage": "calendar",
-            "result": "success",
-            "ics_path": str(ics_path),
-            "event_title": normalized_event.title
-        })
+        Log.kv(
+            stage="calendar",
+            result="success",
+            ics_path=str(ics_path),
+            event_title=normalized_event.title
+        )
         
         return ics_path
         
     except Exception as e:
         Log.error(f"ICS generation failed: {e}")
-        Log.kv({"stage": "calendar", "result": "failed", "error": str(e)})
+        Log.kv(stage="calendar", result="failed", error=str(e))
         return None
 
 
@@ -556,7 +559,7 @@ def _open_calendar_async(ics_path: Path):
     """
     import src.notifications as _notif_mod
     
-    if _notif_mod._SHUTTING_DOWN:
+    if _notif_mod._SHUTDOWN_EVENT.is_set():
         Log.info("[CRASH-TEST] Shutting down - aborting Calendar opener thread.")
         return
     
@@ -576,13 +579,13 @@ def _open_calendar_async(ics_path: Path):
             )
             time.sleep(CALENDAR_OPEN_DELAY_SECONDS)
 
-        if _notif_mod._SHUTTING_DOWN:
+        if _notif_mod._SHUTDOWN_EVENT.is_set():
             Log.info("[CRASH-TEST] Shutting down before Calendar open - aborting")
             return
 
         subprocess.run(['open', '-a', 'Calendar', str(ics_path)], check=True)
         Log.info(f"Opened ICS file in Calendar: {ics_path}")
-        Log.kv({"stage": "calendar", "action": "ics_opened_in_calendar"})
+        Log.kv(stage="calendar", action="ics_opened_in_calendar")
         
         # Brief wait to ensure everything settles
         time.sleep(0.2)
@@ -613,7 +616,7 @@ def create_calendar_event(
     
     # Check if Google Calendar mode is enabled via preference or environment variable
     if calendar_preference is None:
-        use_google_calendar = os.environ.get('USE_GOOGLE_CALENDAR', '').lower() in ('1', 'true', 'yes')
+        use_google_calendar = _USE_GOOGLE_CALENDAR
     else:
         use_google_calendar = calendar_preference == "google"
     
@@ -633,12 +636,12 @@ def create_calendar_event(
         )
         calendar_thread.start()
         
-        Log.kv({
-            "stage": "calendar",
-            "result": "success",
-            "calendar_type": "google",
-            "event_title": normalized_event.title
-        })
+        Log.kv(
+            stage="calendar",
+            result="success",
+            calendar_type="google",
+            event_title=normalized_event.title
+        )
         return None  # No file path for Google Calendar URLs
     else:
         Log.info(f"Creating Apple Calendar event for: {normalized_event.title}")
@@ -55,7 +55,7 @@ def normalize(event: VisionEvent) -> Optional[NormalizedEvent]:
     
     if not event.is_valid():
         Log.warn("Event missing required fields - cannot normalize")
-        Log.kv({"stage": "normalize", "result": "failed", "reason": "missing_fields"})
+        Log.kv(stage="normalize", result="failed", reason="missing_fields")
         return None
     
     try:
@@ -64,7 +64,7 @@ def normalize(event: VisionEvent) -> Optional[NormalizedEvent]:
         
         if start_datetime is None:
             Log.warn("Failed to parse date/time")
-            Log.kv({"stage": "normalize", "result": "failed", "reason": "parse_error"})
+            Log.kv(stage="normalize", result="failed", reason="parse_error")
             return None
         
         # Get timezone info for logging
@@ -94,20 +94,20 @@ def normalize(event: VisionEvent) -> Optional[NormalizedEvent]:
         )
         
         Log.info(f"Normalized event: {normalized.title} at {normalized.start_time} ({tz_display})")
-        Log.kv({
-            "stage": "normalize",
-            "result": "success",
-            "start": normalized.start_time.isoformat(),
-            "end": normalized.end_time.isoformat(),
-            "timezone": tz_display,
-            "duration_min": normalized.duration_minutes()
-        })
+        Log.kv(
+            stage="normalize",
+            result="success",
+            start=normalized.start_time.isoformat(),
+            end=normalized.end_time.isoformat(),
+            timezone=tz_display,
+            duration_min=normalized.duration_minutes()
+        )
         
         return normalized
         
     except Exception as e:
         Log.error(f"Normalization error: {e}")
-        Log.kv({"stage": "normalize", "result": "failed", "error": str(e)})
+        Log.kv(stage="normalize", result="failed", error=str(e))
         return None
 
 
@@ -75,7 +75,7 @@ def capture() -> Optional[Tuple[Image.Image, Dict[str, str]]]:
         
         if screenshot is None:
             Log.error("Screenshot returned None")
-            Log.kv({"stage": "capture", "result": "failed", "reason": "screenshot_none"})
+            Log.kv(stage="capture", result="failed", reason="screenshot_none")
             return None
         
         # Get frontmost app info
@@ -97,13 +97,13 @@ def capture() -> Optional[Tuple[Image.Image, Dict[str, str]]]:
             # Save screenshot
             screenshot.save(screenshot_path)
             Log.info(f"Screenshot saved: {screenshot_path}")
-            Log.kv({
-                "stage": "capture",
-                "result": "success",
-                "app": context['app_name'],
-                "bundle_id": context['bundle_id'],
-                "screenshot_path": str(screenshot_path)
-            })
+            Log.kv(
+                stage="capture",
+                result="success",
+                app=context['app_name'],
+                bundle_id=context['bundle_id'],
+                screenshot_path=str(screenshot_path)
+            )
         except Exception as save_error:
             Log.warn(f"Failed to save screenshot: {save_error}")
             # Continue anyway - screenshot is still returned in memory
@@ -114,6 +114,6 @@ def capture() -> Optional[Tuple[Image.Image, Dict[str, str]]]:
         
     except Exception as e:
         Log.error(f"Capture failed: {e}")
-        Log.kv({"stage": "capture", "result": "failed", "error": str(e)})
+        Log.kv(stage="capture", result="failed", error=str(e))
         return None
 
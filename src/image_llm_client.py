@@ -75,7 +75,7 @@ class StubImageLLMClient(ImageLLMClient):
             event_data = json.loads(stub_response_content)
             if event_data is None:
                 Log.info("No calendar event detected in stub client")
-                Log.kv({"stage": "llm", "provider": "stub", "result": "no_event"})
+                Log.kv(stage="llm", provider="stub", result="no_event")
                 return None
 
             vision_event = VisionEvent(
@@ -89,35 +89,35 @@ class StubImageLLMClient(ImageLLMClient):
 
             if not vision_event.is_valid():
                 Log.warn("Extracted stub event is invalid (missing required fields)")
-                Log.kv({
-                    "stage": "llm",
-                    "provider": "stub",
-                    "result": "failed",
-                    "reason": "invalid_event",
-                    "data": str(event_data)
-                })
+                Log.kv(
+                    stage="llm",
+                    provider="stub",
+                    result="failed",
+                    reason="invalid_event",
+                    data=str(event_data)
+                )
                 return None
 
             Log.info(
                 f"Event extracted (stub): title={vision_event.title}, date={vision_event.date}, time={vision_event.time}, "
                 f"description={vision_event.description}, location={vision_event.location}, participants={vision_event.participants}"
             )
-            Log.kv({
-                "stage": "llm",
-                "provider": "stub",
-                "result": "success",
-                "event_title": vision_event.title,
-                "event_date": vision_event.date,
-                "event_time": vision_event.time,
-                "event_description": vision_event.description,
-                "event_location": vision_event.location,
-                "event_participants": vision_event.participants
-            })
+            Log.kv(
+                stage="llm",
+                provider="stub",
+                result="success",
+                event_title=vision_event.title,
+                event_date=vision_event.date,
+                event_time=vision_event.time,
+                event_description=vision_event.description,
+                event_location=vision_event.location,
+                event_participants=vision_event.participants
+            )
 
             return vision_event
         except Exception as e:
             Log.error(f"Unexpected error in StubImageLLMClient: {e}")
-            Log.kv({"stage": "llm", "provider": "stub", "result": "failed", "reason": "unexpected_error", "error": str(e)})
+            Log.kv(stage="llm", provider="stub", result="failed", reason="unexpected_error", error=str(e))
             return None
 
 class StubImageLLMClient_NoEventDetected(ImageLLMClient):
@@ -140,11 +140,11 @@ class StubImageLLMClient_NoEventDetected(ImageLLMClient):
         Log.info("Simulated API response received")
         
         Log.info("Simulating: LLM detected NO calendar event in the image.")
-        Log.kv({
-            "stage": "llm",
-            "provider": "stub_noevent",
-            "result": "no_event"
-        })
+        Log.kv(
+            stage="llm",
+            provider="stub_noevent",
+            result="no_event"
+        )
         # Simulate same output as OpenAI client for no-event case
         return None
 
@@ -204,7 +204,7 @@ class OpenAIImageLLMClient(ImageLLMClient):
             
         except Exception as e:
             Log.error(f"Image validation failed: {e}")
-            Log.kv({"stage": "llm", "error": "image_validation_failed", "details": str(e)})
+            Log.kv(stage="llm", error="image_validation_failed", details=str(e))
             return False
     
     def _image_to_base64(self, image: Image.Image) -> Optional[str]:
@@ -249,7 +249,7 @@ class OpenAIImageLLMClient(ImageLLMClient):
             
         except Exception as e:
             Log.error(f"Failed to convert image to base64: {e}")
-            Log.kv({"stage": "llm", "error": "base64_conversion_failed", "details": str(e)})
+            Log.kv(stage="llm", error="base64_conversion_failed", details=str(e))
             return None
     
     def extract_event(self, image: Image.Image, context: dict) -> Optional[VisionEvent]:
@@ -269,19 +269,19 @@ class OpenAIImageLLMClient(ImageLLMClient):
         # Edge case 1: Validate image
         if not self._validate_image(image):
             Log.error("Image validation failed - cannot process")
-            Log.kv({"stage": "llm", "provider": "openai", "result": "failed", "reason": "invalid_image"})
+            Log.kv(stage="llm", provider="openai", result="failed", reason="invalid_image")
             return None
         
         # Edge case 2: Convert to base64
         base64_image = self._image_to_base64(image)
         if base64_image is None:
             Log.error("Failed to convert image to base64")
-            Log.kv({"stage": "llm", "provider": "openai", "result": "failed", "reason": "base64_conversion_failed"})
+            Log.kv(stage="llm", provider="openai", result="failed", reason="base64_conversion_failed")
             return None
         
         # Log image details for debugging
         Log.info(f"Image base64 length: {len(base64_image)} chars")
-        Log.kv({"stage": "llm", "image_base64_length": len(base64_image), "image_size": f"{image.size[0]}x{image.size[1]}"})
+        Log.kv(stage="llm", image_base64_length=len(base64_image), image_size=f"{image.size[0]}x{image.size[1]}")
         
         # Construct prompt that includes window and app context
         import datetime
@@ -348,14 +348,14 @@ class OpenAIImageLLMClient(ImageLLMClient):
             Log.info("Calling OpenAI Vision API...")
             Log.info(f"Payload structure: model={self.model}, messages=1, content_items={len(payload['messages'][0]['content'])}")
             Log.info(f"Content types: {[item.get('type') for item in payload['messages'][0]['content']]}")
-            Log.kv({
-                "stage": "llm",
-                "provider": "openai",
-                "model": self.model,
-                "status": "requesting",
-                "image_included": True,
-                "base64_preview": base64_image[:50] + "..." if len(base64_image) > 50 else base64_image
-            })
+            Log.kv(
+                stage="llm",
+                provider="openai",
+                model=self.model,
+                status="requesting",
+                image_included=True,
+                base64_preview=base64_image[:50] + "..." if len(base64_image) > 50 else base64_image
+            )
             
             # Make API call
             response = requests.post(
@@ -384,7 +384,7 @@ class OpenAIImageLLMClient(ImageLLMClient):
             
             if not content:
                 Log.warn("Empty response from OpenAI")
-                Log.kv({"stage": "llm", "provider": "openai", "result": "failed", "reason": "empty_response"})
+                Log.kv(stage="llm", provider="openai", result="failed", reason="empty_response")
                 return None
             
             # Parse JSON from response
@@ -406,13 +406,13 @@ class OpenAIImageLLMClient(ImageLLMClient):
                     event_data = json.loads(json_match.group())
                 else:
                     Log.warn(f"Could not parse JSON from response: {content[:100]}")
-                    Log.kv({"stage": "llm", "provider": "openai", "result": "failed", "reason": "json_parse_error"})
+                    Log.kv(stage="llm", provider="openai", result="failed", reason="json_parse_error")
                     return None
             
             # Check if null (no event found)
             if event_data is None:
                 Log.info("OpenAI detected no calendar event in image")
-                Log.kv({"stage": "llm", "provider": "openai", "result": "no_event"})
+                Log.kv(stage="llm", provider="openai", result="no_event")
                 return None
             
             # Create VisionEvent from response
@@ -427,41 +427,41 @@ class OpenAIImageLLMClient(ImageLLMClient):
             
             if not vision_event.is_valid():
                 Log.warn("Extracted event is invalid (missing required fields)")
-                Log.kv({
-                    "stage": "llm",
-                    "provider": "openai",
-                    "result": "failed",
-                    "reason": "invalid_event",
-                    "data": str(event_data)
-                })
+                Log.kv(
+                    stage="llm",
+                    provider="openai",
+                    result="failed",
+                    reason="invalid_event",
+                    data=str(event_data)
+                )
                 return None
             
             Log.info(
                 f"Event extracted: title={vision_event.title}, date={vision_event.date}, time={vision_event.time}, "
                 f"description={vision_event.description}, location={vision_event.location}, participants={vision_event.participants}"
             )
-            Log.kv({
-                "stage": "llm",
-                "provider": "openai",
-                "result": "success",
-                "event_title": vision_event.title,
-                "event_date": vision_event.date,
-                "event_time": vision_event.time,
-                "event_description": vision_event.description,
-                "event_location": vision_event.location,
-                "event_participants": vision_event.participants
-            })
+            Log.kv(
+                stage="llm",
+                provider="openai",
+                result="success",
+                event_title=vision_event.title,
+                event_date=vision_event.date,
+                event_time=vision_event.time,
+                event_description=vision_event.description,
+                event_location=vision_event.location,
+                event_participants=vision_event.participants
+            )
             
             return vision_event
             
         except requests.exceptions.RequestException as e:
             Log.error(f"OpenAI API request failed: {e}")
-            Log.kv({"stage": "llm", "provider": "openai", "result": "failed", "reason": "api_error", "error": str(e)})
+            Log.kv(stage="llm", provider="openai", result="failed", reason="api_error", error=str(e))
             return None
             
         except Exception as e:
             Log.error(f"Unexpected error in OpenAI client: {e}")
-            Log.kv({"stage": "llm", "provider": "openai", "result": "failed", "reason": "unexpected_error", "error": str(e)})
+            Log.kv(stage="llm", provider="openai", result="failed", reason="unexpected_error", error=str(e))
             return None
 
 
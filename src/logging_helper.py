@@ -3,6 +3,7 @@ Logging helper module for terminal-first logging.
 All output goes to stdout with formatted prefixes, and also to a log file.
 """
 
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -16,6 +17,11 @@ _log_dir.mkdir(exist_ok=True)
 _log_file_path = _log_dir / f"screencal_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
 _log_file = open(_log_file_path, 'a', encoding='utf-8')
 
+# Minimum level to emit, from SCREENCAL_LOG_LEVEL (debug/info/warn/error).
+# section() and kv() are treated as info.
+_LEVELS = {"debug": 10, "info": 20, "warn": 30, "error": 40}
+_min_level = _LEVELS.get(os.environ.get("SCREENCAL_LOG_LEVEL", "info").strip().lower(), _LEVELS["info"])
+
 
 def _log(message: str):
     """Write message to both stdout and log file."""
@@ -27,20 +33,41 @@ def _log(message: str):
 class Log:
     """Simple logging class that outputs to stdout and log file with formatted prefixes."""
     
+    @staticmethod
+    def is_enabled(level: str) -> bool:
+        """Return True if messages at level ('debug', 'info', 'warn', 'error') are emitted.
+
+        Lets callers skip building expensive f-strings on hot paths.
+        """
+        return _LEVELS.get(level, _LEVELS["info"]) >= _min_level
+    
+    @staticmethod
+    def debug(message: str):
+        """Print a debug message: '[DEBUG] message'"""
+        if _min_level > _LEVELS["debug"]:
+            return
+        _log(f"[DEBUG] {message}")
+    
     @staticmethod
     def section(title: str):
         """Print a section header: blank line + '===== TITLE ====='"""
+        if _min_level > _LEVELS["info"]:
+            return
         _log("")
         _log(f"===== {title} =====")
     
     @staticmethod
     def info(message: str):
         """Print an info message: '[INFO] message'"""
+        if _min_level > _LEVELS["info"]:
+            return
         _log(f"[INFO] {message}")
     
     @staticmethod
     def warn(message: str):
         """Print a warning message: '[WARN] message'"""
+        if _min_level > _LEVELS["warn"]:
+            return
         _log(f"[WARN] {message}")
     
     @staticmethod
@@ -49,14 +76,16 @@ class Log:
         _log(f"[ERROR] {message}")
     
     @staticmethod
-    def kv(pairs: dict):
+    def kv(**fields):
         """
         Print key-value pairs: '[KV] key=value | key2=value2'
         
         Args:
-            pairs: Dictionary of key-value pairs to print
+            **fields: Key-value pairs to print, in call order
         """
-        kv_string = " | ".join([f"{k}={v}" for k, v in pairs.items()])
+        if _min_level > _LEVELS["info"]:
+            return
+        kv_string = " | ".join([f"{k}={v}" for k, v in fields.items()])
         _log(f"[KV] {kv_string}")
     
     @staticmethod
@@ -4,130 +4,139 @@ Uses AppKit to create transparent overlay windows (like "Hold ⌘Q to Quit").
 """
 
 from collections import deque
-import math
+from contextlib import contextmanager
+import subprocess
+import sys
 import threading
 import time
+import weakref
 from enum import Enum
-from typing import Optional
+from functools import partial
+from typing import TYPE_CHECKING, Optional
 
 from src.logging_helper import Log
 
-try:
+# Verbose tracing for the dispatch/close/timer/fade paths, off unless
+# SCREENCAL_LOG_LEVEL=debug. Read once at import so each check is one lookup.
+_TRACE = Log.is_enabled("debug")
+
+if TYPE_CHECKING:
     from AppKit import (
-        NSWindow, NSView, NSColor, NSFont, NSMutableParagraphStyle,
-        NSTextAlignmentCenter, NSWindowStyleMaskBorderless,
-        NSBackingStoreBuffered, NSTextField, NSBezierPath,
+        NSWindow, NSView, NSColor, NSFont, NSWindowStyleMaskBorderless,
+        NSBackingStoreBuffered, NSBezierPath,
         NSApplication, NSAttributedString, NSMakeRect, NSMakeSize,
         NSRectFill, NSVisualEffectView,
         NSVisualEffectMaterialSheet, NSVisualEffectStateActive,
         NSScreen, NSFloatingWindowLevel, NSAnimationContext,
         NSStringDrawingUsesLineFragmentOrigin, NSStringDrawingUsesFontLeading,
-        NSLineBreakByWordWrapping, NSButton, NSBezelStyleRounded
+        NSButton, NSBezelStyleRounded, NSApplicationDidChangeScreenParametersNotification,
+        NSFontAttributeName, NSForegroundColorAttributeName,
     )
     from Foundation import NSObject, NSTimer, NSRunLoop, NSRunLoopCommonModes, NSDictionary
-    from Foundation import NSThread
+    from Foundation import NSThread, NSString, NSNotificationCenter, NSBundle, NSOperationQueue
     import objc
-    APPKIT_AVAILABLE = True
-except ImportError:
-    APPKIT_AVAILABLE = False
-
-
-if APPKIT_AVAILABLE:
+    from libdispatch import (
+        DISPATCH_SOURCE_TYPE_TIMER, DISPATCH_TIME_FOREVER, DISPATCH_TIME_NOW, NSEC_PER_SEC,
+        dispatch_async, dispatch_get_main_queue, dispatch_resume, dispatch_source_cancel,
+        dispatch_source_create, dispatch_source_set_event_handler, dispatch_source_set_timer,
+        dispatch_time,
+    )
+    from Quartz import (
+        CAKeyframeAnimation, CATextLayer, CATransaction,
+        kCAAlignmentCenter, kCAFillModeForwards,
+    )
 
-    class NotificationWindow(object):
-        def __init__(self, ns_window, text_field, text_attributes):
-            self.ns_window = ns_window
-            self.text_field = text_field
-            self.text_attributes = text_attributes
-            self._notification_active = False
-            self._fade_helper = None
-            self._fade_timer = None
+# AppKit is imported on first use (see _ensure_appkit) so processes that never
+# show a notification don't pay for loading the PyObjC bridge.
+# None means "not probed yet".
+APPKIT_AVAILABLE: Optional[bool] = None
+LIBDISPATCH_AVAILABLE = False
+# Callable that queues a callback on the main thread; chosen by _ensure_appkit()
+_MAIN_QUEUE_DISPATCH = None
+
+_APPKIT_NAMES = (
+    "NSWindow", "NSView", "NSColor", "NSFont", "NSWindowStyleMaskBorderless",
+    "NSBackingStoreBuffered", "NSBezierPath",
+    "NSApplication", "NSAttributedString", "NSMakeRect", "NSMakeSize",
+    "NSRectFill", "NSVisualEffectView",
+    "NSVisualEffectMaterialSheet", "NSVisualEffectStateActive",
+    "NSScreen", "NSFloatingWindowLevel", "NSAnimationContext",
+    "NSStringDrawingUsesLineFragmentOrigin", "NSStringDrawingUsesFontLeading",
+    "NSButton", "NSBezelStyleRounded", "NSApplicationDidChangeScreenParametersNotification",
+    "NSFontAttributeName", "NSForegroundColorAttributeName",
+)
+_FOUNDATION_NAMES = (
+    "NSObject", "NSTimer", "NSRunLoop", "NSRunLoopCommonModes", "NSDictionary", "NSThread",
+    "NSString", "NSNotificationCenter", "NSBundle", "NSOperationQueue",
+)
+_LIBDISPATCH_NAMES = (
+    "DISPATCH_SOURCE_TYPE_TIMER", "DISPATCH_TIME_FOREVER", "DISPATCH_TIME_NOW", "NSEC_PER_SEC",
+    "dispatch_async", "dispatch_get_main_queue", "dispatch_resume", "dispatch_source_cancel",
+    "dispatch_source_create", "dispatch_source_set_event_handler", "dispatch_source_set_timer",
+    "dispatch_time",
+)
+_QUARTZ_NAMES = (
+    "CAKeyframeAnimation", "CATextLayer", "CATransaction",
+    "kCAAlignmentCenter", "kCAFillModeForwards",
+)
+
+
+def _ensure_appkit() -> bool:
+    """Import AppKit/Foundation into module globals on first call.
+
+    Returns True when the AppKit overlay can be used. The result is cached in
+    APPKIT_AVAILABLE, so later calls are a single global lookup.
+    """
+    global APPKIT_AVAILABLE, LIBDISPATCH_AVAILABLE, _MAIN_QUEUE_DISPATCH, _DRAW_OPTS
 
+    if APPKIT_AVAILABLE is not None:
+        return APPKIT_AVAILABLE
 
     try:
-        NotificationFadeHelper = objc.lookUpClass("NotificationFadeHelper")  # type: ignore[assignment]
-    except objc.error:
-
-        class NotificationFadeHelper(NSObject):
-            """Helper object owned by NSTimer callbacks to run fade-out animation."""
-
-            def init(self):  # type: ignore[override]
-                self = objc.super(NotificationFadeHelper, self).init()
-                if self is None:
-                    return None
-                self._window_ref = None
-                self._fade_duration = 0.25
-                return self
-
-            def setWindow_(self, notification_window):
-                """Store reference to the active notification window."""
-                self._window_ref = notification_window
-
-            def startFadeOut_(self, timer):  # noqa: N802 - ObjC selector
-                global _SHUTTING_DOWN
-                
-                Log.info("[FADE] startFadeOut_ called")
-                
-                # Don't do anything if shutting down
-                if _SHUTTING_DOWN:
-                    Log.info("[FADE] Shutting down - aborting fade-out")
-                    return
-                
-                Log.info("Starting fade-out animation.")
-                notification_window_ref = self._window_ref
-                if not notification_window_ref or not notification_window_ref._notification_active:
-                    Log.info("[FADE] No active notification window - aborting")
-                    return
-
-                if _SHUTTING_DOWN:
-                    Log.info("[FADE] Shutting down during fade setup - aborting")
-                    return
-
-                if timer is not None and getattr(notification_window_ref, "_fade_timer", None):
-                    try:
-                        Log.info("[FADE] Invalidating existing timer")
-                        notification_window_ref._fade_timer.invalidate()
-                    except Exception as e:
-                        Log.warn(f"[FADE] Error invalidating timer: {e}")
-                    notification_window_ref._fade_timer = None
-
-                def _animation_group(context):
-                    Log.info("[FADE] Animation group started")
-                    if _SHUTTING_DOWN:
-                        Log.info("[FADE] Shutting down during animation - aborting")
-                        return
-                    context.setDuration_(self._fade_duration)
-                    if not _SHUTTING_DOWN and notification_window_ref:
-                        try:
-                            Log.info("[FADE] Setting window alpha to 0.0")
-                            notification_window_ref.ns_window.animator().setAlphaValue_(0.0)
-                        except Exception as e:
-                            Log.warn(f"[FADE] Error setting alpha: {e}")
-
-                def _completion_handler():
-                    Log.info("[FADE] Completion handler called")
+        import AppKit
+        import Foundation
+        import Quartz
+        import objc as _objc
+    except ImportError:
+        APPKIT_AVAILABLE = False
+        return False
 
-                    if _SHUTTING_DOWN:
-                        Log.info("[FADE] Shutting down - aborting completion handler")
-                        return
+    module_globals = globals()
+    for name in _APPKIT_NAMES:
+        module_globals[name] = getattr(AppKit, name)
+    for name in _FOUNDATION_NAMES:
+        module_globals[name] = getattr(Foundation, name)
+    for name in _QUARTZ_NAMES:
+        module_globals[name] = getattr(Quartz, name)
+    module_globals["objc"] = _objc
 
-                    if not notification_window_ref:
-                        Log.info("[FADE] No notification window ref - aborting")
-                        return
+    try:
+        import libdispatch
+        for name in _LIBDISPATCH_NAMES:
+            module_globals[name] = getattr(libdispatch, name)
+        LIBDISPATCH_AVAILABLE = True
+    except ImportError:
+        LIBDISPATCH_AVAILABLE = False
+
+    _DRAW_OPTS = NSStringDrawingUsesLineFragmentOrigin | NSStringDrawingUsesFontLeading
+    _register_objc_classes()
+    _MAIN_QUEUE_DISPATCH = _select_main_dispatch()
+    APPKIT_AVAILABLE = True
+    return True
 
-                    # Check if window is still active before attempting to close
-                    if not getattr(notification_window_ref, "_notification_active", False):
-                        Log.info("[FADE] Window already inactive - skipping close in completion handler")
-                        self._window_ref = None
-                        return
 
-                    # Close the window (this will also mark it as inactive)
-                    _close_notification_window(notification_window_ref, source="fade")
-                    self._window_ref = None
-                    Log.info("[FADE] Completion handler finished")
+def _register_objc_classes():
+    """Define the Objective-C helper classes once per process.
 
-                NSAnimationContext.runAnimationGroup_completionHandler_(_animation_group, _completion_handler)
+    The ready flag lives in the module dict rather than being reset at import,
+    so a module reload reuses the classes registered by the first import
+    instead of asking PyObjC to build them again.
+    """
+    global _MainThreadDispatchHelper, ScreenCalCancelButtonTarget
+    global _NOTIF_CLASSES_READY
 
+    if globals().get("_NOTIF_CLASSES_READY", False):
+        return
 
     class _MainThreadDispatchHelper(NSObject):
         """Utility object to dispatch Python callables onto the main thread."""
@@ -146,63 +155,128 @@ if APPKIT_AVAILABLE:
                 self._callback()
             finally:
                 self._callback = None
-else:
-    NotificationWindow = None  # type: ignore[assignment]
-    NotificationFadeHelper = None  # type: ignore[assignment]
+
+    class ScreenCalCancelButtonTarget(NSObject):  # type: ignore[misc]
+        """Objective-C bridge to handle cancel button clicks."""
+
+        def cancelButtonPressed_(self, _sender):  # noqa: N802
+            _handle_cancel_button_press()
+
+    _NOTIF_CLASSES_READY = True
+
+
+class NotificationWindow(object):
+    __slots__ = (
+        "ns_window", "text_layer", "text_attributes", "title",
+        "cancel_button", "cancel_target",
+        "_window_width", "_window_height", "_max_text_width", "_max_text_height",
+        "_bounding_size", "_notification_active", "_fade_source", "_text_height",
+        "_last_message", "_fade_animation", "__weakref__",
+    )
+
+    def __init__(self, ns_window, text_layer, text_attributes):
+        self.ns_window = ns_window
+        self.text_layer = text_layer
+        self.text_attributes = text_attributes
+        self.title = None
+        self.cancel_button = None
+        self.cancel_target = None
+        # Geometry, filled in by _create_overlay_window
+        self._window_width = 0.0
+        self._window_height = 0.0
+        self._max_text_width = 0.0
+        self._max_text_height = 0.0
+        self._bounding_size = None
+        self._notification_active = False
+        self._fade_source = None
+        self._text_height = None
+        self._last_message = None
+        self._fade_animation = None
+
+
+def _select_main_dispatch():
+    """Pick the cheapest way to queue a callable on the main thread (called once)."""
+    if LIBDISPATCH_AVAILABLE:
+        main_queue = dispatch_get_main_queue()
+        return lambda callback: dispatch_async(main_queue, callback)
+
+    main_runloop = NSRunLoop.mainRunLoop()
+    if hasattr(main_runloop, 'performBlock_'):
+        return main_runloop.performBlock_
+
+    # Pre-10.12 systems: the main operation queue also runs on the main run loop
+    return NSOperationQueue.mainQueue().addOperationWithBlock_
+
+
+def _async_on_main(callback):
+    """Queue a callable on the main thread without waiting for it to run."""
+    _MAIN_QUEUE_DISPATCH(callback)
 
 
 def _dispatch_to_main(callback):
     """Ensure the provided callable runs on the main thread."""
-    global _SHUTTING_DOWN
     
-    if _SHUTTING_DOWN:
-        Log.info("[DISPATCH] Shutting down - aborting dispatch")
+    if _SHUTDOWN_EVENT.is_set():
+        if _TRACE:
+            Log.debug("[DISPATCH] Shutting down - aborting dispatch")
         return
     
     if not APPKIT_AVAILABLE:
         callback()
         return
 
-    # Check if we're on main thread using Python threading first (safer)
-    # This avoids AppKit access from background threads which can cause crashes
-    try:
-        is_main_thread = threading.current_thread() is threading.main_thread()
-        if is_main_thread:
-            # We're on main thread - safe to call directly
-            callback()
-            return
-    except Exception:
-        # If threading check fails, fall through to AppKit check
-        pass
+    # Python's main thread is the process's initial thread, which is also the
+    # AppKit main thread; checking it avoids AppKit access from background threads
+    if threading.get_ident() == _MAIN_THREAD_IDENT:
+        callback()
+        return
 
-    # If not on main thread, dispatch using AppKit
-    # Wrap AppKit calls in try-except to handle crashes gracefully
     try:
-        Log.info("[DISPATCH] Dispatching to main thread")
-        try:
-            main_runloop = NSRunLoop.mainRunLoop()
-            if hasattr(main_runloop, 'performBlock_'):
-                main_runloop.performBlock_(callback)
-                return
-        except Exception as e:
-            Log.warn(f"[DISPATCH] performBlock_ failed: {e}, trying alternative")
-        
-        try:
-            helper = _MainThreadDispatchHelper.alloc().initWithCallable_(callback)
-            helper.performSelectorOnMainThread_withObject_waitUntilDone_(
-                'run:', None, False
-            )
-        except Exception as e:
-            Log.warn(f"[DISPATCH] performSelectorOnMainThread failed: {e}")
-            # Last resort: try calling callback directly (risky but better than crashing)
-            Log.warn("[DISPATCH] Falling back to direct callback call (may be unsafe)")
-            callback()
+        if _TRACE:
+            Log.debug("[DISPATCH] Dispatching to main thread")
+        _async_on_main(callback)
     except Exception as e:
         Log.warn(f"[DISPATCH] Error dispatching: {e}")
+        # Last resort: try calling callback directly (risky but better than crashing)
+        Log.warn("[DISPATCH] Falling back to direct callback call (may be unsafe)")
+        callback()
+
 
-# Track currently visible notification and queue of pending notifications
-_ACTIVE_NOTIFICATION = None
-_PENDING_NOTIFICATIONS = deque()
+# Overlay window kept ordered out between notifications and reused by the next one
+_WINDOW_POOL: Optional[NotificationWindow] = None
+# (message, int(max_width), int(max_height)) -> wrapped text height, see _measure_text_height
+_TEXT_HEIGHT_CACHE = {}
+# NSString drawing options for text measurement, set once by _ensure_appkit
+_DRAW_OPTS = 0
+# Overlay window size (more compact for top-right) and distance from the screen edges
+_WINDOW_WIDTH = 380  # Increased from 320 to accommodate longer text
+_WINDOW_HEIGHT = 90  # Increased from 80 to 90 for more vertical space
+_WINDOW_MARGIN = 20
+# Screen-dependent layout, filled by _refresh_screen_cache() on first show and
+# invalidated on NSApplicationDidChangeScreenParametersNotification
+_CACHED_WINDOW_RECT = None
+_CACHED_CONTENTS_SCALE = None
+_CACHED_BG_CG_COLOR = None
+_SCREEN_OBSERVER = None
+# UNUserNotificationCenter for system banners, see _system_notification_center()
+_UN_CENTER = None
+# Long-lived `osascript -i` used for banner fallbacks, see _banner_notification
+_OSASCRIPT_PROC = None
+_OSASCRIPT_LOCK = threading.Lock()
+# (title, message) -> quoted AppleScript command line for the preset banners
+_BANNER_COMMANDS = {}
+_UN_CENTER_CHECKED = False
+_UN_CENTER_LOCK = threading.Lock()
+# Strong reference: UNUserNotificationCenter only holds its delegate weakly
+_UN_DELEGATE = None
+# How long a worker thread waits for the per-hand-off settings query
+_UN_SETTINGS_WAIT_SECONDS = 0.5
+# Fixed message -> NSString, built with the first window so transitions don't re-bridge the text
+_NSSTRING_CACHE = {}
+# (font, attributes, text CGColor) for the overlay text, see _shared_text_style
+_SHARED_TEXT_STYLE = None
+# Cancel button title -> black NSAttributedString, see _style_cancel_button
+_ATTR_STRING_CACHE = {}
 
 _NOTIFICATION_TITLE = "ScreenCal"
 _CAPTURE_MESSAGE = "Screen captured, passing information to LLM"
@@ -211,6 +285,14 @@ _EVENT_DETECTED_MESSAGE = "Event detected, creating appointment"
 _NO_EVENT_MESSAGE = "No event detected"
 _CALENDAR_MESSAGE = "Opening calendar"
 
+# Pre-resolved (title, message) pairs for the notify_* helpers
+_PRESET = {
+    "captured": (_NOTIFICATION_TITLE, _CAPTURE_MESSAGE),
+    "event": (_NOTIFICATION_TITLE, _EVENT_DETECTED_MESSAGE),
+    "no_event": (_NOTIFICATION_TITLE, _NO_EVENT_MESSAGE),
+    "open_cal": (_NOTIFICATION_TITLE, _CALENDAR_MESSAGE),
+}
+
 
 class NotificationState(Enum):
     IDLE = "idle"
@@ -220,16 +302,78 @@ class NotificationState(Enum):
     NO_EVENT = "no_event"
 
 
-_CURRENT_STATE = NotificationState.IDLE
-_STATE_START_TIME = 0.0
-_MIN_DISPLAY_TIMER: Optional[threading.Timer] = None
-_SHUTTING_DOWN = False
+class _State(object):
+    """Mutable notification state, read and written on the main thread.
+
+    notification_shutdown() only clears it, from whichever thread quits.
+    """
+
+    __slots__ = ("active", "pending", "current", "state_start_ns", "min_display_timer")
+
+    def __init__(self):
+        # Currently visible notification
+        self.active: Optional[NotificationWindow] = None
+        # Bounded so a burst of notifications can't pile up; the oldest pending ones are dropped
+        self.pending = deque(maxlen=2)
+        self.current = NotificationState.IDLE
+        # time.monotonic_ns() when the current state was entered
+        self.state_start_ns = 0
+        # Dispatch timer source on the main queue, or an NSTimer without libdispatch
+        self.min_display_timer = None
+
+
+_STATE = _State()
+# Latest transition requested via _transition_state and not yet applied on the main thread
+_PENDING_TRANSITION = None
+_TRANSITION_SCHEDULED = False
+_TRANSITION_LOCK = threading.Lock()
+# Nesting depth of notification_batch(); transitions are held back while > 0
+_BATCH_DEPTH = 0
+# Latest (message, timeout) passed to update_notification and not yet applied
+_PENDING_UPDATE = None
+_UPDATE_SCHEDULED = False
+_UPDATE_LOCK = threading.Lock()
+# Set once by notification_shutdown(); every entry point checks it first
+_SHUTDOWN_EVENT = threading.Event()
 _CANCEL_HANDLER = None
+# Ident of the process's initial thread, which is also the AppKit main thread
+_MAIN_THREAD_IDENT = threading.main_thread().ident
 
 _MIN_CAPTURE_DISPLAY = 2.0
+_MIN_CAPTURE_DISPLAY_NS = int(_MIN_CAPTURE_DISPLAY * 1_000_000_000)
 _EVENT_FADE_TIMEOUT = 3.0
 _NO_EVENT_FADE_TIMEOUT = 2.5
 _CALENDAR_FADE_TIMEOUT = 2.0
+_FADE_IN_DURATION = 0.18
+_FADE_OUT_DURATION = 0.25
+_TIMER_LEEWAY = 0.1  # seconds a dispatch timer may be delayed for coalescing
+_FADE_ANIMATION_KEY = "screencalFade"
+
+# (state, event) -> (next state, message, fade timeout, start min-display timer).
+# A None state matches any current state; see _fire_event.
+_TRANSITIONS = {
+    (None, "capture_complete"): (
+        NotificationState.SCREEN_CAPTURED, _CAPTURE_MESSAGE, None, True,
+    ),
+    (NotificationState.IDLE, "llm_start"): (
+        NotificationState.PROCESSING_LLM, _PROCESSING_MESSAGE, None, False,
+    ),
+    (NotificationState.SCREEN_CAPTURED, "llm_start"): (
+        NotificationState.PROCESSING_LLM, _PROCESSING_MESSAGE, None, False,
+    ),
+    (NotificationState.SCREEN_CAPTURED, "min_display_elapsed"): (
+        NotificationState.PROCESSING_LLM, _PROCESSING_MESSAGE, None, False,
+    ),
+    (None, "event_detected"): (
+        NotificationState.EVENT_DETECTED, _EVENT_DETECTED_MESSAGE, None, False,
+    ),
+    (None, "no_event"): (
+        NotificationState.NO_EVENT, _NO_EVENT_MESSAGE, _NO_EVENT_FADE_TIMEOUT, False,
+    ),
+    (None, "calendar_opening"): (
+        NotificationState.EVENT_DETECTED, _CALENDAR_MESSAGE, _CALENDAR_FADE_TIMEOUT, False,
+    ),
+}
 
 
 def _close_notification_window(notification_window=None, source="unknown") -> bool:
@@ -242,49 +386,42 @@ def _close_notification_window(notification_window=None, source="unknown") -> bo
     Returns:
         True if a window was closed or already cleaned up, False if nothing to do.
     """
-    global _ACTIVE_NOTIFICATION, _CURRENT_STATE, _STATE_START_TIME
 
     if notification_window is None:
-        notification_window = _ACTIVE_NOTIFICATION
+        notification_window = _STATE.active
 
     if notification_window is None:
-        Log.info(f"[CLOSE:{source}] No notification window to close")
+        if _TRACE:
+            Log.debug(f"[CLOSE:{source}] No notification window to close")
         return False
 
     # Check if window is already inactive - prevents double-close race condition
-    if not getattr(notification_window, "_notification_active", False):
-        Log.info(f"[CLOSE:{source}] Window already inactive - skipping close")
+    if not notification_window._notification_active:
+        if _TRACE:
+            Log.debug(f"[CLOSE:{source}] Window already inactive - skipping close")
         return False
 
     # Mark as inactive IMMEDIATELY to prevent concurrent close attempts
     notification_window._notification_active = False
-    Log.info(f"[CLOSE:{source}] Marked window as inactive")
+    if _TRACE:
+        Log.debug(f"[CLOSE:{source}] Marked window as inactive")
 
     def _close_on_main():
-        global _ACTIVE_NOTIFICATION, _CURRENT_STATE, _STATE_START_TIME
+        if _TRACE:
+            Log.debug(f"[CLOSE:{source}] Closing notification window on main thread")
 
-        Log.info(f"[CLOSE:{source}] Closing notification window on main thread")
+        # Cancel pending fade-out and drop any in-flight keyframe fade
+        _cancel_fade_source(notification_window)
+        notification_window._fade_animation = None
 
-        # Cancel fade timer if present
-        fade_timer = getattr(notification_window, "_fade_timer", None)
-        if fade_timer is not None:
+        if APPKIT_AVAILABLE and not _SHUTDOWN_EVENT.is_set():
             try:
-                fade_timer.invalidate()
-                Log.info(f"[CLOSE:{source}] NSTimer invalidated")
-            except Exception as exc:
-                Log.warn(f"[CLOSE:{source}] Failed to invalidate NSTimer: {exc}")
-        notification_window._fade_timer = None
-
-        # Drop reference to fade helper
-        notification_window._fade_helper = None
-
-        if APPKIT_AVAILABLE and not _SHUTTING_DOWN:
-            try:
-                ns_window = getattr(notification_window, "ns_window", None)
+                ns_window = notification_window.ns_window
                 if ns_window is not None:
                     try:
                         ns_window.orderOut_(None)
-                        Log.info(f"[CLOSE:{source}] NSWindow ordered out")
+                        if _TRACE:
+                            Log.debug(f"[CLOSE:{source}] NSWindow ordered out")
                     except Exception as exc:
                         Log.warn(f"[CLOSE:{source}] Error ordering out NSWindow: {exc}")
 
@@ -293,87 +430,65 @@ def _close_notification_window(notification_window=None, source="unknown") -> bo
                     except Exception:
                         pass  # Safe to ignore if window already gone
 
-                    # Drop reference so autorelease can clean up safely
-                    notification_window.ns_window = None
+                    if notification_window is _WINDOW_POOL:
+                        # Keep the pooled window; clear a finished keyframe fade so
+                        # its filled-forward opacity doesn't hide the next show
+                        try:
+                            ns_window.contentView().layer().removeAnimationForKey_(_FADE_ANIMATION_KEY)
+                        except Exception:
+                            pass
+                    else:
+                        # Drop reference so autorelease can clean up safely
+                        notification_window.ns_window = None
                 else:
-                    Log.info(f"[CLOSE:{source}] NSWindow already None")
+                    if _TRACE:
+                        Log.debug(f"[CLOSE:{source}] NSWindow already None")
             except Exception as exc:
                 Log.warn(f"[CLOSE:{source}] Error handling NSWindow: {exc}")
         else:
-            Log.info(f"[CLOSE:{source}] Skipping NSWindow close (APPKIT_AVAILABLE={APPKIT_AVAILABLE}, _SHUTTING_DOWN={_SHUTTING_DOWN})")
+            if _TRACE:
+                Log.debug(f"[CLOSE:{source}] Skipping NSWindow close (APPKIT_AVAILABLE={APPKIT_AVAILABLE}, shutting_down={_SHUTDOWN_EVENT.is_set()})")
 
         # Clear global Python reference - let PyObjC handle AppKit object lifecycle
         # The autorelease pool created by performSelectorOnMainThread will properly
-        # release the AppKit objects (ns_window, text_field, etc.) when it drains
-        _ACTIVE_NOTIFICATION = None
-        _CURRENT_STATE = NotificationState.IDLE
-        _STATE_START_TIME = 0.0
+        # release the AppKit objects (ns_window, text_layer, etc.) when it drains
+        _STATE.active = None
+        _STATE.current = NotificationState.IDLE
+        _STATE.state_start_ns = 0
         _cancel_min_display_timer()
 
     if not APPKIT_AVAILABLE:
-        Log.info(f"[CLOSE:{source}] AppKit unavailable - clearing references only")
-        _ACTIVE_NOTIFICATION = None
-        _CURRENT_STATE = NotificationState.IDLE
-        _STATE_START_TIME = 0.0
+        if _TRACE:
+            Log.debug(f"[CLOSE:{source}] AppKit unavailable - clearing references only")
+        _STATE.active = None
+        _STATE.current = NotificationState.IDLE
+        _STATE.state_start_ns = 0
         _cancel_min_display_timer()
         return True
 
-    # Check if we're on main thread using Python threading first (safer)
-    # This avoids AppKit access which can cause crashes
-    is_main_thread = False
-    try:
-        is_main_thread = threading.current_thread() is threading.main_thread()
-    except Exception:
-        pass  # Fall through to AppKit check
-
-    if is_main_thread:
-        # We're on main thread - safe to call directly
-        try:
-            # Double-check with AppKit if available (for safety)
-            if NSThread.isMainThread():
-                _close_on_main()
-                return True
-        except Exception:
-            # If AppKit check fails, still call _close_on_main since we're on main thread
-            _close_on_main()
-            return True
+    # Python's main thread is also the AppKit main thread
+    if threading.get_ident() == _MAIN_THREAD_IDENT:
+        _close_on_main()
+        return True
     else:
-        if _SHUTTING_DOWN:
-            Log.info(f"[CLOSE:{source}] Shutting down off-main thread - clearing references without AppKit access")
-            _ACTIVE_NOTIFICATION = None
-            _CURRENT_STATE = NotificationState.IDLE
-            _STATE_START_TIME = 0.0
+        if _SHUTDOWN_EVENT.is_set():
+            if _TRACE:
+                Log.debug(f"[CLOSE:{source}] Shutting down off-main thread - clearing references without AppKit access")
+            _STATE.active = None
+            _STATE.current = NotificationState.IDLE
+            _STATE.state_start_ns = 0
             _cancel_min_display_timer()
         else:
             try:
-                Log.info(f"[CLOSE:{source}] Dispatching close to main thread")
-                # Wrap AppKit calls in try-except
-                try:
-                    main_runloop = NSRunLoop.mainRunLoop()
-                    if hasattr(main_runloop, 'performBlock_'):
-                        main_runloop.performBlock_(_close_on_main)
-                        return True
-                except Exception as e:
-                    Log.warn(f"[CLOSE:{source}] performBlock_ failed: {e}, trying alternative")
-                
-                try:
-                    helper = _MainThreadDispatchHelper.alloc().initWithCallable_(_close_on_main)
-                    helper.performSelectorOnMainThread_withObject_waitUntilDone_(
-                        'run:', None, False
-                    )
-                except Exception as exc:
-                    Log.warn(f"[CLOSE:{source}] Error dispatching close: {exc}")
-                    # Fallback: clear references without AppKit access
-                    _ACTIVE_NOTIFICATION = None
-                    _CURRENT_STATE = NotificationState.IDLE
-                    _STATE_START_TIME = 0.0
-                    _cancel_min_display_timer()
+                if _TRACE:
+                    Log.debug(f"[CLOSE:{source}] Dispatching close to main thread")
+                _async_on_main(_close_on_main)
             except Exception as exc:
-                Log.warn(f"[CLOSE:{source}] Error in dispatch logic: {exc}")
+                Log.warn(f"[CLOSE:{source}] Error dispatching close: {exc}")
                 # Fallback: clear references without AppKit access
-                _ACTIVE_NOTIFICATION = None
-                _CURRENT_STATE = NotificationState.IDLE
-                _STATE_START_TIME = 0.0
+                _STATE.active = None
+                _STATE.current = NotificationState.IDLE
+                _STATE.state_start_ns = 0
                 _cancel_min_display_timer()
 
     return True
@@ -381,208 +496,375 @@ def _close_notification_window(notification_window=None, source="unknown") -> bo
 
 def _cancel_min_display_timer():
     """Cancel the minimum display timer if it's running."""
-    global _MIN_DISPLAY_TIMER
-    timer = _MIN_DISPLAY_TIMER
+    timer = _STATE.min_display_timer
     if timer is None:
         return
     try:
-        timer.cancel()
+        if LIBDISPATCH_AVAILABLE:
+            dispatch_source_cancel(timer)
+        elif threading.get_ident() == _MAIN_THREAD_IDENT:
+            # NSTimers must be invalidated on the run loop thread that owns
+            # them; elsewhere (shutdown) the callback's shutdown check stops it.
+            timer.invalidate()
     except Exception:
         pass
     finally:
-        _MIN_DISPLAY_TIMER = None
+        _STATE.min_display_timer = None
 
 
 def _start_min_display_timer():
     """Start or restart the minimum display timer for the capture notification."""
-    global _MIN_DISPLAY_TIMER
     _cancel_min_display_timer()
 
-    timer = threading.Timer(_MIN_CAPTURE_DISPLAY, _handle_minimum_display_elapsed)
-    timer.daemon = True
-    _MIN_DISPLAY_TIMER = timer
-    timer.start()
-
-
-def _handle_minimum_display_elapsed():
-    """Callback when the capture notification has been visible for the minimum duration."""
-    global _SHUTTING_DOWN, _MIN_DISPLAY_TIMER
-    
-    Log.info("[TIMER] Minimum display timer elapsed")
-    
-    if _SHUTTING_DOWN:
-        Log.info("[TIMER] Shutting down - aborting timer callback")
-        _MIN_DISPLAY_TIMER = None
+    # Both fire straight on the main thread: no helper thread, no extra hop
+    if LIBDISPATCH_AVAILABLE:
+        _STATE.min_display_timer = _main_queue_timer(_MIN_CAPTURE_DISPLAY, _on_minimum_display_elapsed)
         return
 
-    def _on_main():
-        global _MIN_DISPLAY_TIMER
-        Log.info("[TIMER] Timer callback on main thread")
-        
-        if _SHUTTING_DOWN:
-            Log.info("[TIMER] Shutting down on main thread - aborting")
-            _MIN_DISPLAY_TIMER = None
-            return
-        
-        _MIN_DISPLAY_TIMER = None
-
-        if _CURRENT_STATE == NotificationState.SCREEN_CAPTURED:
-            Log.info("Capture notification minimum display duration elapsed; updating message.")
-            _transition_state(
-                NotificationState.PROCESSING_LLM,
-                _PROCESSING_MESSAGE,
-                fade_timeout=None,
-                start_min_timer=False,
-            )
-        else:
-            Log.info(f"[TIMER] State is {_CURRENT_STATE.value}, not updating")
+    _STATE.min_display_timer = _main_run_loop_timer(_MIN_CAPTURE_DISPLAY, _on_minimum_display_elapsed)
 
-    _dispatch_to_main(_on_main)
 
+def _on_minimum_display_elapsed():
+    """Advance from the capture message once it has been shown long enough (main thread)."""
+    if _TRACE:
+        Log.debug("[TIMER] Timer callback on main thread")
 
-def _update_active_notification_text_on_main(message: str):
-    """Update the text of the active notification window (main thread only)."""
-    if not APPKIT_AVAILABLE:
+    # Also releases the one-shot dispatch source that invoked us
+    _cancel_min_display_timer()
+
+    if _SHUTDOWN_EVENT.is_set():
+        if _TRACE:
+            Log.debug("[TIMER] Shutting down on main thread - aborting")
         return
 
-    notification_window = _ACTIVE_NOTIFICATION
-    if notification_window is None:
+    if _fire_event("min_display_elapsed", on_main=True):
+        if _TRACE:
+            Log.debug("Capture notification minimum display duration elapsed; updating message.")
+    else:
+        if _TRACE:
+            Log.debug(f"[TIMER] State is {_STATE.current.value}, not updating")
+
+
+def _apply_transition_on_main(notification_window, message: str, fade_timeout: Optional[float]):
+    """Swap the text and fade schedule of the visible notification in one pass (main thread).
+
+    The old fade is cancelled before the text changes. A changed message marks
+    the window for redraw at the end of the run loop cycle, where Core
+    Animation coalesces it; an unchanged one only touches the fade.
+    """
+    if not APPKIT_AVAILABLE or notification_window is None:
         return
 
-    _layout_centered_text(notification_window, message)
-    notification_window.ns_window.displayIfNeeded()
+    _cancel_fade_on_main(notification_window)
+    if message != notification_window._last_message:
+        _layout_centered_text(notification_window, message)
+        notification_window.ns_window.setViewsNeedDisplay_(True)
+    if fade_timeout is not None:
+        _schedule_hold_fade(notification_window, fade_timeout)
 
 
 def _cancel_fade_on_main(notification_window):
     if not APPKIT_AVAILABLE or notification_window is None:
         return
 
-    timer = getattr(notification_window, "_fade_timer", None)
-    if timer is not None:
+    _cancel_fade_source(notification_window)
+
+    if notification_window._fade_animation is not None:
+        # Clear the token first so the transaction's completion block, which
+        # fires when the animation is removed, does not close the window.
+        notification_window._fade_animation = None
         try:
-            timer.invalidate()
+            notification_window.ns_window.contentView().layer().removeAnimationForKey_(_FADE_ANIMATION_KEY)
         except Exception:
             pass
-    notification_window._fade_timer = None
+
+
+def _schedule_keyframe_fade(notification_window, timeout: float, fade_in: bool = True) -> bool:
+    """Fade in, hold for timeout seconds and fade out as one Core Animation keyframe.
+
+    With fade_in False the window is already visible and the animation only
+    holds and fades out. Returns False when the content view has no layer, in
+    which case the caller falls back to the timer-driven fade.
+    """
+    layer = notification_window.ns_window.contentView().layer()
+    if layer is None:
+        return False
+
+    animation = CAKeyframeAnimation.animationWithKeyPath_("opacity")
+    if fade_in:
+        total = _FADE_IN_DURATION + timeout + _FADE_OUT_DURATION
+        animation.setValues_([0.0, 1.0, 1.0, 0.0])
+        animation.setKeyTimes_([0.0, _FADE_IN_DURATION / total, (_FADE_IN_DURATION + timeout) / total, 1.0])
+    else:
+        total = timeout + _FADE_OUT_DURATION
+        animation.setValues_([1.0, 1.0, 0.0])
+        animation.setKeyTimes_([0.0, timeout / total, 1.0])
+    animation.setDuration_(total)
+    animation.setRemovedOnCompletion_(False)
+    animation.setFillMode_(kCAFillModeForwards)
+
+    token = object()
+    notification_window._fade_animation = token
+    window_ref = weakref.ref(notification_window)
+
+    def _fade_finished():
+        assert NSThread.isMainThread(), "fade completion must run on the main thread"
+        window = window_ref()
+        if window is None or window._fade_animation is not token:
+            return
+        window._fade_animation = None
+        _close_notification_window(window, source="fade")
+
+    # The window itself stays at alpha 1.0; the layer opacity drives visibility.
+    notification_window.ns_window.setAlphaValue_(1.0)
+    CATransaction.begin()
+    CATransaction.setCompletionBlock_(_fade_finished)
+    layer.addAnimation_forKey_(animation, _FADE_ANIMATION_KEY)
+    CATransaction.commit()
+    return True
 
 
 def _reschedule_fade_on_main(notification_window, timeout: float):
     if not APPKIT_AVAILABLE or notification_window is None:
         return
 
-    if timeout is None:
-        _cancel_fade_on_main(notification_window)
+    _cancel_fade_on_main(notification_window)
+    if timeout is not None:
+        _schedule_hold_fade(notification_window, timeout)
+
+
+def _schedule_hold_fade(notification_window, timeout: float):
+    """Fade out an already visible window after timeout seconds (main thread)."""
+    if not _schedule_keyframe_fade(notification_window, timeout, fade_in=False):
+        _schedule_fade(notification_window, timeout)
+
+
+def _schedule_fade(notification_window, timeout: float):
+    """Start the fade-out after timeout seconds (main thread).
+
+    Uses a one-shot dispatch timer source on the main queue with some leeway
+    so the system can coalesce the wakeup with other timers. Falls back to an
+    NSTimer when libdispatch is not installed.
+
+    The window holds the timer in _fade_source, so the handler only keeps a
+    weak reference back to the window.
+    """
+    window_ref = weakref.ref(notification_window)
+
+    def _fire():
+        window = window_ref()
+        if window is not None:
+            _start_fade_out(window)
+
+    if LIBDISPATCH_AVAILABLE:
+        source = _main_queue_timer(timeout, _fire)
+    else:
+        source = _main_run_loop_timer(timeout, _fire)
+    notification_window._fade_source = source
+
+
+def _main_queue_timer(delay: float, handler):
+    """Start a one-shot dispatch timer source that runs handler on the main queue."""
+    source = dispatch_source_create(DISPATCH_SOURCE_TYPE_TIMER, 0, 0, dispatch_get_main_queue())
+    dispatch_source_set_timer(
+        source,
+        dispatch_time(DISPATCH_TIME_NOW, int(delay * NSEC_PER_SEC)),
+        DISPATCH_TIME_FOREVER,
+        int(_TIMER_LEEWAY * NSEC_PER_SEC),
+    )
+    dispatch_source_set_event_handler(source, handler)
+    dispatch_resume(source)
+    return source
+
+
+def _main_run_loop_timer(delay: float, handler):
+    """Start a one-shot NSTimer on the main run loop in the common modes.
+
+    scheduledTimer... only registers the default mode, so the timer would not
+    fire while the status bar menu is tracking events.
+    """
+    helper = _MainThreadDispatchHelper.alloc().initWithCallable_(handler)
+    timer = NSTimer.timerWithTimeInterval_target_selector_userInfo_repeats_(
+        delay, helper, 'run:', None, False
+    )
+    NSRunLoop.mainRunLoop().addTimer_forMode_(timer, NSRunLoopCommonModes)
+    return timer
+
+
+def _cancel_fade_source(notification_window):
+    """Cancel a pending fade-out scheduled by _schedule_fade, if any."""
+    source = notification_window._fade_source
+    if source is None:
         return
+    notification_window._fade_source = None
+    try:
+        if LIBDISPATCH_AVAILABLE:
+            # Cancelling is safe from any thread; libdispatch releases the
+            # event handler (and the window it references) once cancelled.
+            dispatch_source_cancel(source)
+        else:
+            source.invalidate()
+    except Exception as exc:
+        Log.warn(f"[FADE] Failed to cancel fade timer: {exc}")
 
-    _cancel_fade_on_main(notification_window)
 
-    fade_helper = getattr(notification_window, "_fade_helper", None)
-    if fade_helper is None and NotificationFadeHelper is not None:
-        fade_helper = NotificationFadeHelper.alloc().init()
-        fade_helper.setWindow_(notification_window)
-        notification_window._fade_helper = fade_helper
+def _start_fade_out(notification_window):
+    """Animate the window to transparent, then close it (main thread)."""
+    if _SHUTDOWN_EVENT.is_set():
+        if _TRACE:
+            Log.debug("[FADE] Shutting down - aborting fade-out")
+        return
 
-    if fade_helper is None:
+    if _TRACE:
+        Log.debug("Starting fade-out animation.")
+    if notification_window is None or not notification_window._notification_active:
+        if _TRACE:
+            Log.debug("[FADE] No active notification window - aborting")
         return
 
-    timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-        timeout,
-        fade_helper,
-        'startFadeOut:',
-        None,
-        False,
+    _cancel_fade_source(notification_window)
+
+    NSAnimationContext.runAnimationGroup_completionHandler_(
+        partial(_animate_alpha, notification_window.ns_window, _FADE_OUT_DURATION, 0.0),
+        partial(_finish_fade_out, notification_window),
     )
-    notification_window._fade_timer = timer
 
 
-def _layout_centered_text(notification_window, message: str):
-    """Update the notification text and center it within the window."""
-    if not APPKIT_AVAILABLE or notification_window is None:
-        return
+def _noop():
+    pass
 
-    text_field = getattr(notification_window, "text_field", None)
-    if text_field is None:
+
+def _animate_alpha(ns_window, duration: float, alpha: float, context):
+    """NSAnimationContext group body animating ns_window to alpha."""
+    context.setDuration_(duration)
+    try:
+        ns_window.animator().setAlphaValue_(alpha)
+    except Exception as e:
+        Log.warn(f"[FADE] Error setting alpha: {e}")
+
+
+def _finish_fade_out(notification_window):
+    """Fade-out completion handler: close the window (main thread)."""
+    assert NSThread.isMainThread(), "fade completion must run on the main thread"
+    if _SHUTDOWN_EVENT.is_set():
         return
+    # Skips windows that were already closed (e.g. by reset) during the fade
+    _close_notification_window(notification_window, source="fade")
 
-    attributes = getattr(notification_window, "text_attributes", {}) or {}
 
-    # Ensure we have a centered paragraph style stored
-    paragraph_style = attributes.get('NSParagraphStyle')
-    if paragraph_style is None:
-        paragraph_style = NSMutableParagraphStyle.alloc().init()
-        paragraph_style.setAlignment_(NSTextAlignmentCenter)
-        attributes['NSParagraphStyle'] = paragraph_style
+def _ceil_int(value: float) -> int:
+    """Round a non-negative layout dimension up to a whole point."""
+    whole = int(value)
+    return whole + 1 if value > whole else whole
 
-    # Rebuild attributed string with the stored attributes
-    attributed_string = NSAttributedString.alloc().initWithString_attributes_(message, attributes)
 
-    max_width = getattr(notification_window, "_max_text_width", text_field.frame().size.width)
-    max_height = getattr(notification_window, "_max_text_height", text_field.frame().size.height)
+def _measure_text_height(message: str, attributes, max_width: float, max_height: float,
+                         bounding_size=None) -> float:
+    """Return the wrapped height of message, memoized per message and text box size.
 
-    options = NSStringDrawingUsesLineFragmentOrigin | NSStringDrawingUsesFontLeading
-    bounding_rect = attributed_string.boundingRectWithSize_options_(
-        NSMakeSize(max_width, max_height),
-        options,
+    Every overlay uses the same font, and the set of messages is small, so the
+    cache saves a text-layout pass on each state transition. bounding_size is
+    the window's precomputed NSSize for the text box, if it has one.
+    """
+    key = (message, int(max_width), int(max_height))
+    cached = _TEXT_HEIGHT_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    if bounding_size is None:
+        bounding_size = NSMakeSize(max_width, max_height)
+    ns_message = _NSSTRING_CACHE.get(message) or NSString.stringWithString_(message)
+    bounding_rect = ns_message.boundingRectWithSize_options_attributes_(
+        bounding_size,
+        _DRAW_OPTS,
+        attributes,
     )
 
     # Calculate text height from bounding rect (allows wrapping)
-    text_height = min(max_height, math.ceil(bounding_rect.size.height))
+    text_height = min(max_height, _ceil_int(bounding_rect.size.height))
 
     if text_height <= 0:
         # Fallback to a single line height based on the current font
-        font = attributes.get('NSFont', text_field.font())
+        font = attributes.get('NSFont')
         if font is not None:
-            text_height = math.ceil(font.ascender() - font.descender())
+            text_height = _ceil_int(font.ascender() - font.descender())
         else:
             text_height = max_height
 
-    window_width = getattr(notification_window, "_window_width", max_width)
-    window_height = getattr(notification_window, "_window_height", max_height)
+    _TEXT_HEIGHT_CACHE[key] = text_height
+    return text_height
 
-    # Always use full max_width for text field to allow proper wrapping
-    # The bounding rect calculation handles wrapping, but the text field needs full width
-    text_width = max_width
-    text_x = (window_width - text_width) / 2.0
-    text_y = (window_height - text_height) / 2.0
 
-    text_field.setFrame_(NSMakeRect(text_x, text_y, text_width, text_height))
-    text_field.setAttributedStringValue_(attributed_string)
+def _layout_centered_text(notification_window, message: str):
+    """Update the notification text and center it within the window."""
+    if not APPKIT_AVAILABLE or notification_window is None:
+        return
 
-    # Ensure multi-line centered text rendering
-    text_field.setAlignment_(NSTextAlignmentCenter)
-    text_field.setMaximumNumberOfLines_(0)
-    cell = text_field.cell()
-    if cell is not None:
-        cell.setWraps_(True)
-        cell.setLineBreakMode_(NSLineBreakByWordWrapping)
+    text_layer = notification_window.text_layer
+    if text_layer is None:
+        return
+
+    attributes = notification_window.text_attributes or {}
+
+    max_width = notification_window._max_text_width
+    max_height = notification_window._max_text_height
+
+    # CATextLayer draws from the top of its frame, so size the frame to the
+    # wrapped text height and center that frame vertically. Only move the
+    # layer when the height actually changes.
+    text_height = _measure_text_height(
+        message, attributes, max_width, max_height,
+        notification_window._bounding_size,
+    )
+    if text_height != notification_window._text_height:
+        window_width = notification_window._window_width
+        window_height = notification_window._window_height
+
+        text_width = max_width
+        text_x = (window_width - text_width) / 2.0
+        text_y = (window_height - text_height) / 2.0
+
+        text_layer.setFrame_(NSMakeRect(text_x, text_y, text_width, text_height))
+        notification_window._text_height = text_height
+
+    if message != notification_window._last_message:
+        text_layer.setString_(_NSSTRING_CACHE.get(message, message))
+        notification_window._last_message = message
 
 
 def _present_or_update_notification_on_main(message: str, fade_timeout: Optional[float]):
-    global _SHUTTING_DOWN
-    
-    if _SHUTTING_DOWN:
+    if _SHUTDOWN_EVENT.is_set():
         return
     
     if not APPKIT_AVAILABLE:
         show_notification(_NOTIFICATION_TITLE, message, fade_timeout if fade_timeout is not None else 3.0)
         return
 
-    global _ACTIVE_NOTIFICATION
-    notification_window = _ACTIVE_NOTIFICATION
+    state = _STATE
+    notification_window = state.active
 
-    if notification_window is None or not getattr(notification_window, "_notification_active", False):
+    if notification_window is None or not notification_window._notification_active:
         _show_overlay_window(_NOTIFICATION_TITLE, message, fade_timeout)
-        notification_window = _ACTIVE_NOTIFICATION
+        # _show_overlay_window sets the active window
+        notification_window = state.active
         if fade_timeout is None and notification_window is not None:
             _cancel_fade_on_main(notification_window)
         return
 
-    _update_active_notification_text_on_main(message)
+    _apply_transition_on_main(notification_window, message, fade_timeout)
 
-    if fade_timeout is None:
-        _cancel_fade_on_main(notification_window)
-    else:
-        _reschedule_fade_on_main(notification_window, fade_timeout)
+
+def _fire_event(event: str, now_ns: Optional[int] = None, on_main: bool = False) -> bool:
+    """Apply the _TRANSITIONS entry for event in the current state, if there is one."""
+    entry = _TRANSITIONS.get((_STATE.current, event)) or _TRANSITIONS.get((None, event))
+    if entry is None:
+        return False
+    new_state, message, fade_timeout, start_min_timer = entry
+    _transition_state(
+        new_state, message, fade_timeout,
+        start_min_timer=start_min_timer, now_ns=now_ns, on_main=on_main,
+    )
+    return True
 
 
 def _transition_state(
@@ -591,77 +873,229 @@ def _transition_state(
     fade_timeout: Optional[float],
     *,
     start_min_timer: bool,
+    now_ns: Optional[int] = None,
+    on_main: bool = False,
 ):
-    """Transition notification state machine to a new state."""
-    global _SHUTTING_DOWN
-    
-    if _SHUTTING_DOWN:
+    """Transition notification state machine to a new state.
+
+    Transitions requested before the main thread gets to them are coalesced:
+    only the latest one is applied, by a single _flush_transition dispatch.
+    now_ns is a time.monotonic_ns() reading already taken on the main thread
+    in the same callback; it becomes the new state's start time. Callers
+    running in a main-thread callback pass on_main=True to flush inline.
+    """
+    global _PENDING_TRANSITION, _TRANSITION_SCHEDULED
+
+    if _SHUTDOWN_EVENT.is_set():
         return
 
-    def _execute_transition():
-        global _CURRENT_STATE, _STATE_START_TIME
+    transition = (new_state, message, fade_timeout, start_min_timer, now_ns)
+    with _TRANSITION_LOCK:
+        pending = _PENDING_TRANSITION
+        if (
+            pending is not None
+            and pending[3]
+            and new_state is NotificationState.PROCESSING_LLM
+        ):
+            # The capture message has not been shown yet, so its minimum
+            # display time has not elapsed; its timer moves on to processing.
+            return
+        _PENDING_TRANSITION = transition
+        if _TRANSITION_SCHEDULED or _BATCH_DEPTH > 0:
+            return
+        _TRANSITION_SCHEDULED = True
 
-        if _SHUTTING_DOWN:
+    if on_main:
+        _flush_transition()
+    else:
+        _dispatch_to_main(_flush_transition)
+
+
+@contextmanager
+def notification_batch():
+    """Hold back state transitions until the outermost batch exits.
+
+    Only the last transition requested inside the batch is applied, with a
+    single main-thread dispatch when the batch ends.
+    """
+    global _BATCH_DEPTH, _TRANSITION_SCHEDULED
+
+    with _TRANSITION_LOCK:
+        _BATCH_DEPTH += 1
+    try:
+        yield
+    finally:
+        with _TRANSITION_LOCK:
+            _BATCH_DEPTH -= 1
+            flush = (
+                _BATCH_DEPTH == 0
+                and _PENDING_TRANSITION is not None
+                and not _TRANSITION_SCHEDULED
+            )
+            if flush:
+                _TRANSITION_SCHEDULED = True
+        if flush:
+            _dispatch_to_main(_flush_transition)
+
+
+def _flush_transition():
+    """Apply the latest pending state transition (main thread)."""
+    global _PENDING_TRANSITION, _TRANSITION_SCHEDULED
+
+    with _TRANSITION_LOCK:
+        transition = _PENDING_TRANSITION
+        _PENDING_TRANSITION = None
+        _TRANSITION_SCHEDULED = False
+
+    if transition is None or _SHUTDOWN_EVENT.is_set():
+        return
+
+    new_state, message, fade_timeout, start_min_timer, now_ns = transition
+
+    if new_state is _STATE.current and not start_min_timer:
+        notification_window = _STATE.active
+        if notification_window is not None and notification_window._last_message == message:
+            # Same state and text already on screen: only the fade needs updating
+            _reschedule_fade_on_main(notification_window, fade_timeout)
             return
 
-        previous_state = _CURRENT_STATE
-        _cancel_min_display_timer()
+    previous_state = _STATE.current
+    _cancel_min_display_timer()
 
-        if start_min_timer and not _SHUTTING_DOWN:
-            _start_min_display_timer()
+    if start_min_timer:
+        _start_min_display_timer()
 
-        _CURRENT_STATE = new_state
-        _STATE_START_TIME = time.monotonic()
+    _STATE.current = new_state
+    _STATE.state_start_ns = now_ns if now_ns is not None else time.monotonic_ns()
 
-        Log.info(
-            f"Notification state transition: {previous_state.value} -> {new_state.value}"
-        )
-        _present_or_update_notification_on_main(message, fade_timeout)
+    Log.info(
+        f"Notification state transition: {previous_state.value} -> {new_state.value}"
+    )
+    _present_or_update_notification_on_main(message, fade_timeout)
 
-    _dispatch_to_main(_execute_transition)
 
 
+def _enqueue_notification_on_main(title: str, message: str, timeout: Optional[float]):
+    """Queue a notification and show it if nothing is visible (main thread only)."""
+    active = _STATE.active
+    if (
+        active is not None
+        and active._notification_active
+        and active._last_message == message
+        and timeout is not None
+    ):
+        # Already on screen: keep it up for another timeout instead of replaying it
+        _reschedule_fade_on_main(active, timeout)
+        return
+
+    pending = _STATE.pending
+    if pending and pending[-1][1] == message:
+        # Same text already waiting: refresh it instead of showing it twice
+        pending[-1] = (title, message, timeout)
+    else:
+        pending.append((title, message, timeout))
+    if Log.is_enabled("info"):
+        Log.info(f"Notification enqueued: {message}")
+    _dequeue_and_show_next()
+
 
 def _dequeue_and_show_next():
     """Show the next pending notification if nothing is currently visible."""
-    global _SHUTTING_DOWN
-    
-    if _SHUTTING_DOWN:
+    if _SHUTDOWN_EVENT.is_set() or not APPKIT_AVAILABLE:
         return
-        
-    if not APPKIT_AVAILABLE:
-        return
-
-    global _ACTIVE_NOTIFICATION
 
-    if _ACTIVE_NOTIFICATION is not None:
+    # AppKit state may only be touched on the main thread; hop there directly
+    if threading.get_ident() != _MAIN_THREAD_IDENT:
+        _async_on_main(_dequeue_and_show_next)
         return
 
-    if not _PENDING_NOTIFICATIONS:
+    if _STATE.active is not None or not _STATE.pending:
         return
 
-    title, message, timeout = _PENDING_NOTIFICATIONS.popleft()
-    Log.info(f"Dequeued notification: {message}")
+    title, message, timeout = _STATE.pending.popleft()
+    if Log.is_enabled("info"):
+        Log.info(f"Dequeued notification: {message}")
     _show_overlay_window(title, message, timeout)
 
+def _refresh_screen_cache():
+    """Cache the overlay window rect, backing scale and background color for the main screen."""
+    global _CACHED_WINDOW_RECT, _CACHED_CONTENTS_SCALE, _CACHED_BG_CG_COLOR
+
+    main_screen = NSScreen.mainScreen()
+    screen = main_screen.frame()
+
+    # Position in top-right corner (macOS coordinates: origin at bottom-left)
+    x = screen.size.width - _WINDOW_WIDTH - _WINDOW_MARGIN  # Right edge with margin
+    y = screen.size.height - _WINDOW_HEIGHT - _WINDOW_MARGIN  # Top edge with margin
+    _CACHED_WINDOW_RECT = NSMakeRect(x, y, _WINDOW_WIDTH, _WINDOW_HEIGHT)
+    _CACHED_CONTENTS_SCALE = main_screen.backingScaleFactor()
+
+    if _CACHED_BG_CG_COLOR is None:
+        # Transparent light silver background color (RGB: 220, 220, 220 with 0.75 alpha)
+        light_silver_color = NSColor.colorWithSRGBRed_green_blue_alpha_(0.86, 0.86, 0.86, 0.75)
+        _CACHED_BG_CG_COLOR = light_silver_color.CGColor()
+
+    _observe_screen_changes()
+
+
+def _observe_screen_changes():
+    """Register (once) to drop the cached geometry when displays change."""
+    global _SCREEN_OBSERVER
+    if _SCREEN_OBSERVER is not None:
+        return
+    _SCREEN_OBSERVER = NSNotificationCenter.defaultCenter().addObserverForName_object_queue_usingBlock_(
+        NSApplicationDidChangeScreenParametersNotification,
+        None,
+        None,
+        _on_screen_parameters_changed,
+    )
+
+
+def _on_screen_parameters_changed(_notification):
+    global _CACHED_WINDOW_RECT, _WINDOW_POOL
+    Log.info("Screen parameters changed; recomputing overlay geometry on next show")
+    _CACHED_WINDOW_RECT = None
+    # The pooled window was placed for the old screen; it is released when it
+    # next closes and a fresh one is created for the new geometry.
+    _WINDOW_POOL = None
+
+
+def _shared_text_style():
+    """Return the (font, measuring attributes, CGColor) shared by every overlay.
+
+    Built with the first window, together with the NSStrings for the fixed
+    messages, and reused by windows recreated after a screen change.
+    """
+    global _SHARED_TEXT_STYLE
+
+    if _SHARED_TEXT_STYLE is None:
+        font = NSFont.systemFontOfSize_(13.0)
+        # Font-only attributes, used to measure wrapped text height for layout
+        attributes = {'NSFont': font}
+        _SHARED_TEXT_STYLE = (font, attributes, NSColor.blackColor().CGColor())
+
+        for fixed_message in (
+            _CAPTURE_MESSAGE,
+            _PROCESSING_MESSAGE,
+            _EVENT_DETECTED_MESSAGE,
+            _NO_EVENT_MESSAGE,
+            _CALENDAR_MESSAGE,
+        ):
+            _NSSTRING_CACHE[fixed_message] = NSString.stringWithString_(fixed_message)
+
+    return _SHARED_TEXT_STYLE
+
+
 def _create_overlay_window(title: str, message: str):
     """Create a transparent overlay window for notifications."""
-    # Get screen size
-    screen = NSScreen.mainScreen().frame()
-    screen_width = screen.size.width
-    screen_height = screen.size.height
-    
-    # Window size (more compact for top-right)
-    window_width = 380  # Increased from 320 to accommodate longer text
-    window_height = 90  # Increased from 80 to 90 for more vertical space
-    
-    # Position in top-right corner (macOS coordinates: origin at bottom-left)
-    margin = 20  # Distance from edges
-    x = screen_width - window_width - margin  # Right edge with margin
-    y = screen_height - window_height - margin  # Top edge with margin
-    
+    if _CACHED_WINDOW_RECT is None:
+        _refresh_screen_cache()
+
+    window_width = _WINDOW_WIDTH
+    window_height = _WINDOW_HEIGHT
+
     # Create borderless window using PyObjC pattern
-    content_rect = NSMakeRect(x, y, window_width, window_height)
+    content_rect = _CACHED_WINDOW_RECT
     
     window = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
         content_rect,
@@ -683,11 +1117,7 @@ def _create_overlay_window(title: str, message: str):
     content_view.setWantsLayer_(True)
     layer = content_view.layer()
     layer.setCornerRadius_(10.0)
-    # Set transparent light silver background color (RGB: 220, 220, 220 with 0.75 alpha)
-    light_silver_color = NSColor.colorWithSRGBRed_green_blue_alpha_(0.86, 0.86, 0.86, 0.75)
-    # Convert NSColor to CGColor for layer background
-    cg_color = light_silver_color.CGColor()
-    layer.setBackgroundColor_(cg_color)
+    layer.setBackgroundColor_(_CACHED_BG_CG_COLOR)
     
     # Dimensions for cancel button and text
     button_width = 80.0
@@ -695,34 +1125,17 @@ def _create_overlay_window(title: str, message: str):
     button_margin = 16.0
     text_right_margin = button_width + button_margin + 8.0
 
-    # Create label for text
-    text_field = NSTextField.alloc().initWithFrame_(
-        NSMakeRect(
-            16,
-            16,
-            window_width - 32 - text_right_margin,
-            window_height - 32 - button_height  # leave room for button at bottom
-        )
-    )
-    text_field.setBezeled_(False)
-    text_field.setDrawsBackground_(False)
-    text_field.setEditable_(False)
-    text_field.setSelectable_(False)
-    
-    # Style the text (smaller font)
-    font = NSFont.systemFontOfSize_(13.0)  # Reduced from 18.0 to 13.0
-    text_field.setFont_(font)
-    text_field.setTextColor_(NSColor.blackColor())  # Black text color
-    
-    # Center align
-    paragraph_style = NSMutableParagraphStyle.alloc().init()
-    paragraph_style.setAlignment_(NSTextAlignmentCenter)
-    # Create attributed string with proper attribute keys
-    attributes = {
-        'NSFont': font,
-        'NSForegroundColor': NSColor.blackColor(),  # Black text color
-        'NSParagraphStyle': paragraph_style
-    }
+    # Create text layer; font, color and wrapping are fixed for the window's lifetime
+    font, attributes, text_color = _shared_text_style()
+    text_layer = CATextLayer.layer()
+    text_layer.setFont_(font)
+    text_layer.setFontSize_(13.0)
+    text_layer.setForegroundColor_(text_color)  # Black text color
+    text_layer.setAlignmentMode_(kCAAlignmentCenter)
+    text_layer.setWrapped_(True)
+    text_layer.setContentsScale_(_CACHED_CONTENTS_SCALE)
+    layer.addSublayer_(text_layer)
+
     # Create cancel button
     cancel_button_y = button_margin
     cancel_button = NSButton.alloc().initWithFrame_(
@@ -742,25 +1155,12 @@ def _create_overlay_window(title: str, message: str):
     cancel_button.layer().setCornerRadius_(6.0)
     cancel_button.layer().setBorderWidth_(0.0)
 
-    try:
-        CancelButtonTarget = objc.lookUpClass("ScreenCalCancelButtonTarget")  # type: ignore[assignment]
-    except objc.error:
-
-        class ScreenCalCancelButtonTarget(NSObject):  # type: ignore[misc]
-            """Objective-C bridge to handle cancel button clicks."""
-
-            def cancelButtonPressed_(self, _sender):  # noqa: N802
-                _handle_cancel_button_press()
-
-        CancelButtonTarget = ScreenCalCancelButtonTarget  # type: ignore[assignment]
-
-    cancel_target = CancelButtonTarget.alloc().init()
+    cancel_target = ScreenCalCancelButtonTarget.alloc().init()
     cancel_button.setTarget_(cancel_target)
     cancel_button.setAction_("cancelButtonPressed:")
     cancel_button.setContinuous_(False)
 
     # Add to view
-    content_view.addSubview_(text_field)
     content_view.addSubview_(cancel_button)
     window.setContentView_(content_view)
     
@@ -768,12 +1168,15 @@ def _create_overlay_window(title: str, message: str):
     window.setAlphaValue_(0.0)
     
     # Wrap the NSWindow in our custom NotificationWindow class
-    notification_window = NotificationWindow(window, text_field, attributes)
+    notification_window = NotificationWindow(window, text_layer, attributes)
     notification_window.title = title
     notification_window._window_width = window_width
     notification_window._window_height = window_height
     notification_window._max_text_width = window_width - 32 - text_right_margin  # Reduce to account for button
     notification_window._max_text_height = window_height - 32  # 16px padding on each side
+    notification_window._bounding_size = NSMakeSize(
+        notification_window._max_text_width, notification_window._max_text_height
+    )
     notification_window.cancel_button = cancel_button
     notification_window.cancel_target = cancel_target
 
@@ -784,82 +1187,173 @@ def _create_overlay_window(title: str, message: str):
     return notification_window
 
 
+def _acquire_overlay_window(title: str, message: str):
+    """Return the pooled overlay window set up for message, creating it if needed.
+
+    While the pooled window is still the active one (its close has not run on
+    the main thread yet), a throwaway window is created instead.
+    """
+    global _WINDOW_POOL
+
+    pooled = _WINDOW_POOL
+    if pooled is not None and pooled is not _STATE.active and pooled.ns_window is not None:
+        pooled.title = title
+        _layout_centered_text(pooled, message)
+        _style_cancel_button(pooled.cancel_button, _CANCEL_HANDLER is not None)
+        return pooled
+
+    notification_window = _create_overlay_window(title, message)
+    if pooled is None:
+        _WINDOW_POOL = notification_window
+    return notification_window
+
+
+def _applescript_string(value: str) -> str:
+    """Quote value as an AppleScript string literal on a single line."""
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return '"' + escaped.replace("\r", " ").replace("\n", " ") + '"'
+
+
+def _post_fallback_notification(title: str, message: str) -> bool:
+    """Post message without the overlay; returns False if nothing was shown.
+
+    Prefers UserNotifications when AppKit loaded (the overlay itself failed),
+    then the osascript banner. Off macOS there is no banner to post.
+    """
+    if sys.platform != "darwin":
+        Log.info(f"Notification (no overlay available): {message}")
+        return False
+    if APPKIT_AVAILABLE and _emit_system_notification(title, message):
+        return True
+    return _banner_notification(title, message)
+
+
+def _banner_notification(title: str, message: str) -> bool:
+    """Post a banner through a long-lived `osascript -i` child.
+
+    The interpreter is started on first use and fed one command per line, so
+    only the first fallback pays the process launch. Returns False if the
+    command could not be delivered.
+    """
+    global _OSASCRIPT_PROC
+
+    command = _BANNER_COMMANDS.get((title, message))
+    if command is None:
+        command = (
+            f"display notification {_applescript_string(message)} "
+            f"with title {_applescript_string(title)}\n"
+        )
+        if len(_BANNER_COMMANDS) < 32:
+            _BANNER_COMMANDS[(title, message)] = command
+    with _OSASCRIPT_LOCK:
+        if _SHUTDOWN_EVENT.is_set():
+            return False
+        # One retry in case the interpreter exited since the last banner
+        for _ in range(2):
+            proc = _OSASCRIPT_PROC
+            if proc is None or proc.poll() is not None:
+                try:
+                    proc = subprocess.Popen(
+                        ['osascript', '-i'],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        text=True,
+                    )
+                except OSError as exc:
+                    Log.warn(f"Could not start osascript for banner notification: {exc}")
+                    _OSASCRIPT_PROC = None
+                    return False
+                _OSASCRIPT_PROC = proc
+            try:
+                proc.stdin.write(command)
+                proc.stdin.flush()
+                return True
+            except (BrokenPipeError, OSError, ValueError):
+                _OSASCRIPT_PROC = None
+        return False
+
+
+def _stop_osascript():
+    """Close the banner interpreter started by _banner_notification, if any."""
+    global _OSASCRIPT_PROC
+
+    with _OSASCRIPT_LOCK:
+        proc = _OSASCRIPT_PROC
+        _OSASCRIPT_PROC = None
+    if proc is None:
+        return
+    try:
+        proc.stdin.close()
+    except (BrokenPipeError, OSError, ValueError):
+        pass
+    try:
+        proc.terminate()
+    except OSError:
+        pass
+
+
 def _show_overlay_window(title: str, message: str, timeout: Optional[float] = 3.0):
     """Show overlay window and animate fade in/out. Must be called on main thread."""
-    global _ACTIVE_NOTIFICATION, _SHUTTING_DOWN
     
-    if _SHUTTING_DOWN:
+    if _SHUTDOWN_EVENT.is_set():
         return
     
-    Log.info(f"Creating overlay window with message: '{message}' and timeout: {timeout}")
+    if Log.is_enabled("info"):
+        Log.info(f"Creating overlay window with message: '{message}' and timeout: {timeout}")
     if not APPKIT_AVAILABLE:
         # Fallback to banner notification
-        try:
-            import subprocess
-            subprocess.Popen(
-                ['osascript', '-e', f'display notification "{message}" with title "ScreenCal"'],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
+        if _post_fallback_notification("ScreenCal", message):
             Log.info(f"Fell back to banner notification: {message}")
-        except:
-            pass
         return
-    
+
+    assert NSThread.isMainThread(), "_show_overlay_window must run on the main thread"
+
     try:
-        # Ensure NSApplication is running and activated
+        # Activate so the first click lands on the cancel button instead of
+        # only activating the app
         app = NSApplication.sharedApplication()
         app.activateIgnoringOtherApps_(True)
-        
-        # Create overlay window (must be on main thread)
-        notification_window = _create_overlay_window(title, message)
+
+        # Reuse the pooled overlay window, creating it on first use (must be on main thread)
+        notification_window = _acquire_overlay_window(title, message)
         
         # Set notification active flag on the wrapper object
         notification_window._notification_active = True
 
         # Ensure window starts fully transparent before animating in
         notification_window.ns_window.setAlphaValue_(0.0)
-        notification_window.ns_window.makeKeyAndOrderFront_(None)
-        notification_window.ns_window.orderFront_(None)
+        # Borderless windows can't become key, so only order it front
+        notification_window.ns_window.orderFrontRegardless()
         Log.info("Overlay window created and ordered front.")
 
-        # Fade the window in for a subtle appearance
-        def _fade_in_group(context):
-            context.setDuration_(0.18)
-            notification_window.ns_window.animator().setAlphaValue_(1.0)
-
-        NSAnimationContext.runAnimationGroup_completionHandler_(_fade_in_group, lambda: None)
+        if timeout is not None and _schedule_keyframe_fade(notification_window, timeout):
+            _STATE.active = notification_window
+            if Log.is_enabled("info"):
+                Log.info(f"Scheduled keyframe fade for {timeout} seconds")
+            return
 
-        # Prepare fade helper and schedule fade out after timeout
-        fade_helper = NotificationFadeHelper.alloc().init()
-        fade_helper.setWindow_(notification_window)
-        notification_window._fade_helper = fade_helper
+        # Fade the window in for a subtle appearance
+        NSAnimationContext.runAnimationGroup_completionHandler_(
+            partial(_animate_alpha, notification_window.ns_window, _FADE_IN_DURATION, 1.0),
+            _noop,
+        )
 
+        # Schedule fade out after timeout
         if timeout is not None:
-            timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-                timeout, fade_helper, 'startFadeOut:', None, False
-            )
-            notification_window._fade_timer = timer
-            Log.info(f"Scheduled fade-out timer for {timeout} seconds")
+            _schedule_fade(notification_window, timeout)
+            if Log.is_enabled("info"):
+                Log.info(f"Scheduled fade-out timer for {timeout} seconds")
         else:
-            notification_window._fade_timer = None
             Log.info("Notification will remain visible until dismissed explicitly")
 
-        _ACTIVE_NOTIFICATION = notification_window
+        _STATE.active = notification_window
         
     except Exception as e:
         Log.warn(f"Error showing overlay window: {e}")
         # Fallback to banner notification
-        try:
-            import subprocess
-            subprocess.Popen(
-                ['osascript', '-e', f'display notification "{message}" with title "{title}"'],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-        except:
-            pass
-        _ACTIVE_NOTIFICATION = None
+        _post_fallback_notification(title, message)
+        _STATE.active = None
         _dequeue_and_show_next()
 
 
@@ -877,85 +1371,44 @@ def show_notification(title: str, message: str, timeout: Optional[float] = 3.0)
     Returns:
         True if notification was shown successfully, False otherwise
     """
+    if _SHUTDOWN_EVENT.is_set():
+        return False
+
     try:
-        Log.info(f"show_notification called. APPKIT_AVAILABLE: {APPKIT_AVAILABLE}")
-        if APPKIT_AVAILABLE:
-            try:
-                Log.info(f"Is main thread: {NSThread.isMainThread()}")
-            except Exception:
-                # AppKit check failed, use Python threading instead
-                is_main = threading.current_thread() is threading.main_thread()
-                Log.info(f"Is main thread (Python): {is_main}")
-        if not APPKIT_AVAILABLE:
+        appkit_ready = _ensure_appkit()
+        if _TRACE:
+            Log.debug(f"show_notification called. APPKIT_AVAILABLE: {appkit_ready}")
+        is_main_thread = threading.get_ident() == _MAIN_THREAD_IDENT
+        if appkit_ready and _TRACE:
+            Log.debug(f"Is main thread: {is_main_thread}")
+        if not appkit_ready:
             # Fallback to banner notification
-            try:
-                import subprocess
-                subprocess.Popen(
-                    ['osascript', '-e', f'display notification "{message}" with title "ScreenCal"'],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-                Log.info(f"Fell back to banner notification: {message}")
-                return True
-            except:
+            if not _post_fallback_notification("ScreenCal", message):
                 return False
+            Log.info(f"Fell back to banner notification: {message}")
+            return True
         
         def enqueue_on_main():
-            _PENDING_NOTIFICATIONS.append((title, message, timeout))
-            Log.info(f"Notification enqueued: {message}")
-            _dequeue_and_show_next()
-
-        # Check if we're on main thread using Python threading first (safer)
-        is_main_thread = False
-        try:
-            is_main_thread = threading.current_thread() is threading.main_thread()
-        except Exception:
-            pass  # Fall through to AppKit check
+            _enqueue_notification_on_main(title, message, timeout)
 
         if is_main_thread:
-            try:
-                # Double-check with AppKit if available
-                if NSThread.isMainThread():
-                    enqueue_on_main()
-                    return True
-            except Exception:
-                # If AppKit check fails, still call enqueue_on_main since we're on main thread
-                enqueue_on_main()
-                return True
+            enqueue_on_main()
+            return True
         else:
             try:
-                main_runloop = NSRunLoop.mainRunLoop()
-                if hasattr(main_runloop, 'performBlock_'):
-                    main_runloop.performBlock_(enqueue_on_main)
-                else:
-                    class EnqueueRunner(NSObject):
-                        def run_block(self):
-                            enqueue_on_main()
-
-                    runner = EnqueueRunner.alloc().init()
-                    runner.performSelectorOnMainThread_withObject_waitUntilDone_(
-                        'run_block', None, False
-                    )
+                _async_on_main(enqueue_on_main)
             except Exception as e:
                 Log.warn(f"Error scheduling notification enqueue on main thread: {e}")
                 enqueue_on_main()
         
-        timeout_desc = f"{timeout}s" if timeout is not None else "no timeout"
-        Log.info(f"Overlay notification shown: {message} (will fade out in {timeout_desc})")
+        if _TRACE:
+            timeout_desc = f"{timeout}s" if timeout is not None else "no timeout"
+            Log.debug(f"Overlay notification shown: {message} (will fade out in {timeout_desc})")
         return True
     except Exception as e:
         Log.warn(f"Error showing notification: {e}")
         # Fallback to banner notification
-        try:
-            import subprocess
-            subprocess.Popen(
-                ['osascript', '-e', f'display notification "{message}" with title "ScreenCal"'],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-            return True
-        except:
-            return False
+        return _post_fallback_notification("ScreenCal", message)
 
 
 def register_cancel_handler(handler):
@@ -978,10 +1431,10 @@ def _update_cancel_button_state():
     """Enable or disable the cancel button based on handler availability."""
     if not APPKIT_AVAILABLE:
         return
-    notification_window = _ACTIVE_NOTIFICATION
+    notification_window = _STATE.active
     if notification_window is None:
         return
-    cancel_button = getattr(notification_window, "cancel_button", None)
+    cancel_button = notification_window.cancel_button
     if cancel_button is None:
         return
     _style_cancel_button(cancel_button, _CANCEL_HANDLER is not None)
@@ -996,9 +1449,9 @@ def _handle_cancel_button_press():
         Log.warn("AppKit unavailable; cannot process cancel button.")
         return
 
-    notification_window = _ACTIVE_NOTIFICATION
+    notification_window = _STATE.active
     if notification_window is not None:
-        cancel_button = getattr(notification_window, "cancel_button", None)
+        cancel_button = notification_window.cancel_button
         if cancel_button is not None:
             cancel_button.setEnabled_(False)
 
@@ -1036,12 +1489,15 @@ def _style_cancel_button(cancel_button, enabled: bool):
 
     try:
         title_string = cancel_button.title()
-        font = cancel_button.font() or NSFont.systemFontOfSize_(13.0)
-        attrs = {
-            NSFontAttributeName: font,
-            NSForegroundColorAttributeName: title_color,
-        }
-        attributed_title = NSAttributedString.alloc().initWithString_attributes_(title_string, attrs)
+        attributed_title = _ATTR_STRING_CACHE.get(title_string)
+        if attributed_title is None:
+            font = cancel_button.font() or NSFont.systemFontOfSize_(13.0)
+            attrs = {
+                NSFontAttributeName: font,
+                NSForegroundColorAttributeName: title_color,
+            }
+            attributed_title = NSAttributedString.alloc().initWithString_attributes_(title_string, attrs)
+            _ATTR_STRING_CACHE[title_string] = attributed_title
         cancel_button.setAttributedTitle_(attributed_title)
     except Exception:
         try:
@@ -1055,76 +1511,260 @@ def _style_cancel_button(cancel_button, enabled: bool):
 
 
 def update_notification(message: str, timeout: Optional[float] = None) -> bool:
-    """Update currently visible notification with new message and optional timeout."""
+    """Update currently visible notification with new message and optional timeout.
 
-    if not APPKIT_AVAILABLE:
+    Updates requested before the main thread applies them are coalesced, so
+    only the latest message and timeout are shown. Returns True once the
+    update is scheduled; failures are logged.
+    """
+    global _PENDING_UPDATE, _UPDATE_SCHEDULED
+
+    if _SHUTDOWN_EVENT.is_set():
+        return False
+
+    if not _ensure_appkit():
         # Fall back to showing a new banner notification
         return show_notification(_NOTIFICATION_TITLE, message, timeout if timeout is not None else 3.0)
 
-    result = {"success": False}
+    with _UPDATE_LOCK:
+        _PENDING_UPDATE = (message, timeout)
+        if _UPDATE_SCHEDULED:
+            return True
+        _UPDATE_SCHEDULED = True
 
-    def _update():
-        notification_window = _ACTIVE_NOTIFICATION
-        if notification_window is None or not getattr(notification_window, "_notification_active", False):
-            result["success"] = show_notification(
-                _NOTIFICATION_TITLE,
-                message,
-                timeout if timeout is not None else 3.0,
-            )
-            return
+    _dispatch_to_main(_flush_update)
+    return True
 
-        _update_active_notification_text_on_main(message)
 
-        if timeout is None:
-            _cancel_fade_on_main(notification_window)
-        else:
-            _reschedule_fade_on_main(notification_window, timeout)
+def _flush_update():
+    """Apply the latest update requested via update_notification (main thread)."""
+    global _PENDING_UPDATE, _UPDATE_SCHEDULED
+
+    with _UPDATE_LOCK:
+        update = _PENDING_UPDATE
+        _PENDING_UPDATE = None
+        _UPDATE_SCHEDULED = False
+
+    if update is None or _SHUTDOWN_EVENT.is_set():
+        return
+
+    message, timeout = update
+    notification_window = _STATE.active
+    if notification_window is None or not notification_window._notification_active:
+        if not show_notification(
+            _NOTIFICATION_TITLE,
+            message,
+            timeout if timeout is not None else 3.0,
+        ):
+            Log.warn(f"Failed to show notification for update: {message}")
+        return
+
+    _apply_transition_on_main(notification_window, message, timeout)
+
+
+def _system_notification_center():
+    """Return the UNUserNotificationCenter if system banners can be posted, else None.
+
+    Resolved once. UNUserNotificationCenter raises for processes without a
+    bundle identifier (e.g. running from a plain python interpreter), so those
+    keep using the overlay for every message. On success a delegate that
+    presents banners while ScreenCal is frontmost is installed and
+    authorization is requested; without the delegate macOS drops foreground
+    banners, so a failure to install it disables system banners.
+    """
+    global _UN_CENTER, _UN_CENTER_CHECKED
+
+    if _UN_CENTER_CHECKED:
+        return _UN_CENTER
+    with _UN_CENTER_LOCK:
+        if _UN_CENTER_CHECKED:
+            return _UN_CENTER
+        _UN_CENTER = _resolve_system_notification_center()
+        _UN_CENTER_CHECKED = True
+    return _UN_CENTER
+
+
+def _resolve_system_notification_center():
+    """Set up UNUserNotificationCenter for banners. Caller holds _UN_CENTER_LOCK."""
+    global _UN_DELEGATE
+
+    try:
+        import UserNotifications
+    except ImportError:
+        return None
+
+    if NSBundle.mainBundle().bundleIdentifier() is None:
+        Log.info("No bundle identifier - using overlay for all notifications")
+        return None
+
+    try:
+        center = UserNotifications.UNUserNotificationCenter.currentNotificationCenter()
+        _UN_DELEGATE = _foreground_banner_delegate(UserNotifications).alloc().init()
+        center.setDelegate_(_UN_DELEGATE)
+        options = (
+            UserNotifications.UNAuthorizationOptionAlert
+            | UserNotifications.UNAuthorizationOptionSound
+        )
+
+        def _on_authorization(granted, error):
+            if error is not None:
+                Log.warn(f"Notification authorization request failed: {error}")
+            elif not granted:
+                Log.info("System notifications not authorized - using overlay")
+
+        center.requestAuthorizationWithOptions_completionHandler_(options, _on_authorization)
+    except Exception as e:
+        Log.warn(f"UserNotifications unavailable: {e} - using overlay for all notifications")
+        _UN_DELEGATE = None
+        return None
+    return center
+
+
+def _foreground_banner_delegate(user_notifications):
+    """Return the UNUserNotificationCenterDelegate class, defining it on first use."""
+    global ScreenCalNotificationCenterDelegate
+
+    if "ScreenCalNotificationCenterDelegate" in globals():
+        return ScreenCalNotificationCenterDelegate
+
+    # Banner/List replace Alert on macOS 11+
+    presentation = getattr(user_notifications, "UNNotificationPresentationOptionBanner", None)
+    if presentation is None:
+        presentation = user_notifications.UNNotificationPresentationOptionAlert
+    else:
+        presentation |= user_notifications.UNNotificationPresentationOptionList
+
+    class ScreenCalNotificationCenterDelegate(  # type: ignore[misc]
+        NSObject, protocols=[objc.protocolNamed("UNUserNotificationCenterDelegate")]
+    ):
+        """Presents ScreenCal's banners even while the app is frontmost."""
 
-        result["success"] = True
+        def userNotificationCenter_willPresentNotification_withCompletionHandler_(  # noqa: N802
+            self, _center, _notification, completion_handler
+        ):
+            completion_handler(presentation)
 
-    _dispatch_to_main(_update)
+    return ScreenCalNotificationCenterDelegate
 
-    return result["success"]
+
+def _system_notifications_authorized(center) -> bool:
+    """Re-read the authorization status; True only if banners are currently allowed.
+
+    Queried on every hand-off so a revocation mid-session takes effect. The
+    answer arrives on a background queue, so the main thread never waits for
+    it and keeps the overlay instead.
+    """
+    if threading.get_ident() == _MAIN_THREAD_IDENT:
+        return False
+
+    try:
+        from UserNotifications import (
+            UNAuthorizationStatusAuthorized,
+            UNAuthorizationStatusProvisional,
+        )
+    except ImportError:
+        return False
+
+    status = []
+    answered = threading.Event()
+
+    def _on_settings(settings):
+        status.append(settings.authorizationStatus())
+        answered.set()
+
+    try:
+        center.getNotificationSettingsWithCompletionHandler_(_on_settings)
+    except Exception as e:
+        Log.warn(f"Could not read notification settings: {e}")
+        return False
+    if not answered.wait(_UN_SETTINGS_WAIT_SECONDS):
+        return False
+    return status[0] in (UNAuthorizationStatusAuthorized, UNAuthorizationStatusProvisional)
+
+
+def _emit_system_notification(title: str, message: str) -> bool:
+    """Post a system banner for messages that don't need the overlay.
+
+    Returns False when system notifications can't be used or aren't
+    authorized right now, so the caller falls back to the overlay. A failure
+    reported later by the completion handler can't be recovered from, hence
+    the up-front authorization check.
+    """
+    center = _system_notification_center()
+    if center is None or not _system_notifications_authorized(center):
+        return False
+
+    try:
+        from UserNotifications import UNMutableNotificationContent, UNNotificationRequest
+
+        content = UNMutableNotificationContent.alloc().init()
+        content.setTitle_(title)
+        content.setBody_(message)
+        # Fixed identifier so a newer banner replaces the previous one
+        request = UNNotificationRequest.requestWithIdentifier_content_trigger_(
+            "screencal-notify", content, None
+        )
+
+        def _on_added(error):
+            if error is not None:
+                Log.warn(f"System notification failed: {error}")
+
+        center.addNotificationRequest_withCompletionHandler_(request, _on_added)
+        return True
+    except Exception as e:
+        Log.warn(f"Error posting system notification: {e}")
+        return False
+
+
+def _dismiss_overlay_for_system_notification():
+    """Close the overlay (and reset the state machine) after handing off to a system banner."""
+    _dispatch_to_main(lambda: _close_notification_window(source="system"))
 
 
 def notification_on_capture_complete() -> bool:
     """State-machine aware notification for successful screen capture."""
 
-    if not APPKIT_AVAILABLE:
+    if _SHUTDOWN_EVENT.is_set():
+        return False
+
+    if not _ensure_appkit():
         return notify_screen_captured(timeout=_MIN_CAPTURE_DISPLAY)
 
-    _transition_state(
-        NotificationState.SCREEN_CAPTURED,
-        _CAPTURE_MESSAGE,
-        fade_timeout=None,
-        start_min_timer=True,
-    )
+    _fire_event("capture_complete")
+    # Set up system banners (and ask for authorization) while the LLM runs,
+    # so the first hand-off doesn't pay for it
+    _system_notification_center()
     return True
 
 
 def notification_on_llm_processing_start():
     """Optional hook when LLM processing begins."""
 
-    if not APPKIT_AVAILABLE:
+    if _SHUTDOWN_EVENT.is_set():
+        return
+
+    if not _ensure_appkit():
+        return
+
+    # Lockless pre-check: skip the main-thread hop when the transition below
+    # would not happen. _maybe_transition re-checks on the main thread.
+    state = _STATE.current
+    if (state, "llm_start") not in _TRANSITIONS:
+        return
+    if (
+        state is NotificationState.SCREEN_CAPTURED
+        and time.monotonic_ns() - _STATE.state_start_ns < _MIN_CAPTURE_DISPLAY_NS
+    ):
         return
 
     def _maybe_transition():
-        if _CURRENT_STATE == NotificationState.SCREEN_CAPTURED:
-            elapsed = time.monotonic() - _STATE_START_TIME
-            if elapsed >= _MIN_CAPTURE_DISPLAY:
-                _transition_state(
-                    NotificationState.PROCESSING_LLM,
-                    _PROCESSING_MESSAGE,
-                    fade_timeout=None,
-                    start_min_timer=False,
-                )
-        elif _CURRENT_STATE == NotificationState.IDLE:
-            _transition_state(
-                NotificationState.PROCESSING_LLM,
-                _PROCESSING_MESSAGE,
-                fade_timeout=None,
-                start_min_timer=False,
-            )
+        now_ns = time.monotonic_ns()
+        if (
+            _STATE.current is NotificationState.SCREEN_CAPTURED
+            and now_ns - _STATE.state_start_ns < _MIN_CAPTURE_DISPLAY_NS
+        ):
+            return
+        _fire_event("llm_start", now_ns=now_ns, on_main=True)
 
     _dispatch_to_main(_maybe_transition)
 
@@ -1132,7 +1772,10 @@ def notification_on_llm_processing_start():
 def notification_on_llm_complete(event_found: bool):
     """Update notification based on LLM outcome."""
 
-    if not APPKIT_AVAILABLE:
+    if _SHUTDOWN_EVENT.is_set():
+        return
+
+    if not _ensure_appkit():
         if event_found:
             notify_event_detected(timeout=_EVENT_FADE_TIMEOUT)
         else:
@@ -1140,34 +1783,28 @@ def notification_on_llm_complete(event_found: bool):
         return
 
     if event_found:
-        _transition_state(
-            NotificationState.EVENT_DETECTED,
-            _EVENT_DETECTED_MESSAGE,
-            fade_timeout=None,
-            start_min_timer=False,
-        )
+        _fire_event("event_detected")
+    elif _emit_system_notification(_NOTIFICATION_TITLE, _NO_EVENT_MESSAGE):
+        _dismiss_overlay_for_system_notification()
     else:
-        _transition_state(
-            NotificationState.NO_EVENT,
-            _NO_EVENT_MESSAGE,
-            fade_timeout=_NO_EVENT_FADE_TIMEOUT,
-            start_min_timer=False,
-        )
+        _fire_event("no_event")
 
 
 def notification_on_calendar_opening():
     """Notify user that Calendar is about to open."""
 
-    if not APPKIT_AVAILABLE:
+    if _SHUTDOWN_EVENT.is_set():
+        return
+
+    if not _ensure_appkit():
         notify_calendar_opening(timeout=_CALENDAR_FADE_TIMEOUT)
         return
 
-    _transition_state(
-        NotificationState.EVENT_DETECTED,
-        _CALENDAR_MESSAGE,
-        fade_timeout=_CALENDAR_FADE_TIMEOUT,
-        start_min_timer=False,
-    )
+    if _emit_system_notification(_NOTIFICATION_TITLE, _CALENDAR_MESSAGE):
+        _dismiss_overlay_for_system_notification()
+        return
+
+    _fire_event("calendar_opening")
 
 
 def notification_reset():
@@ -1176,16 +1813,13 @@ def notification_reset():
     Uses asynchronous dispatch to avoid autorelease pool conflicts.
     The window will be closed on the main thread asynchronously.
     """
-    global _SHUTTING_DOWN
     
-    if _SHUTTING_DOWN:
+    if _SHUTDOWN_EVENT.is_set():
         Log.info("[RESET] Shutting down - skipping reset")
         return
     
     def _dismiss():
-        global _ACTIVE_NOTIFICATION
-        
-        notification_window = _ACTIVE_NOTIFICATION
+        notification_window = _STATE.active
         if notification_window is None:
             Log.info("[RESET] No active notification to dismiss")
             return
@@ -1193,25 +1827,11 @@ def notification_reset():
         # Close window on main thread
         _close_notification_window(notification_window, source="reset")
 
-    # Check if we're on main thread using Python threading first (safer)
-    # This avoids AppKit access which can cause crashes
-    is_main_thread = False
-    try:
-        is_main_thread = threading.current_thread() is threading.main_thread()
-    except Exception:
-        pass  # Fall through to dispatch
-
-    if is_main_thread:
+    # Compare thread idents rather than asking AppKit, which can crash off the main thread
+    if threading.get_ident() == _MAIN_THREAD_IDENT:
         # We're on main thread - safe to call directly
-        try:
-            # Double-check with AppKit if available (for safety)
-            if NSThread.isMainThread():
-                _dismiss()
-                return
-        except Exception:
-            # If AppKit check fails, still call _dismiss since we're on main thread
-            _dismiss()
-            return
+        _dismiss()
+        return
     else:
         # Use asynchronous dispatch to avoid autorelease pool conflicts
         # Synchronous dispatch creates an autorelease pool that conflicts with
@@ -1228,69 +1848,71 @@ def notification_shutdown():
     IMPORTANT: Do NOT access AppKit objects during shutdown.
     When rumps.quit_application() is called, NSApplication starts tearing down
     and all NSWindows are automatically deallocated. Accessing them causes segfaults.
-    We only need to cancel Python timers and clear references.
+    We only need to cancel pending timers and clear references.
     """
-    global _SHUTTING_DOWN, _ACTIVE_NOTIFICATION, _CURRENT_STATE, _STATE_START_TIME
+    global _WINDOW_POOL
     
     Log.section("Notification Shutdown")
-    if _SHUTTING_DOWN:
+    if _SHUTDOWN_EVENT.is_set():
         Log.info("Shutdown already in progress - skipping")
         return
 
     Log.info("Starting notification shutdown sequence")
     
     # Set shutdown flag FIRST to prevent any new operations
-    _SHUTTING_DOWN = True
-    Log.info("_SHUTTING_DOWN flag set to True")
+    _SHUTDOWN_EVENT.set()
+    Log.info("Shutdown event set")
 
-    # Cancel Python threading timer - this is safe
-    Log.info("Cancelling Python threading timer")
+    # Cancel the minimum display timer - a dispatch source cancel is thread-safe
+    Log.info("Cancelling minimum display timer")
     _cancel_min_display_timer()
-    Log.info("Python timer cancelled")
+    Log.info("Minimum display timer cancelled")
 
     # Clear Python references only - do NOT access AppKit objects
     # AppKit will handle its own cleanup when NSApplication terminates
     Log.info("Clearing Python references")
-    _ACTIVE_NOTIFICATION = None
-    _CURRENT_STATE = NotificationState.IDLE
-    _STATE_START_TIME = 0.0
-    _PENDING_NOTIFICATIONS.clear()
+    _STATE.active = None
+    _WINDOW_POOL = None
+    _STATE.current = NotificationState.IDLE
+    _STATE.state_start_ns = 0
+    _STATE.pending.clear()
+    _ATTR_STRING_CACHE.clear()
+
+    _stop_osascript()
 
     Log.info("Notification shutdown complete - all references cleared")
 
 
+def _fast_show(preset, timeout: Optional[float]) -> bool:
+    """Show a preset notification, bypassing show_notification on the main thread."""
+    if _SHUTDOWN_EVENT.is_set():
+        return False
+
+    title, message = preset
+    if (
+        APPKIT_AVAILABLE
+        and threading.get_ident() == _MAIN_THREAD_IDENT
+    ):
+        _enqueue_notification_on_main(title, message, timeout)
+        return True
+    return show_notification(title, message, timeout=timeout)
+
+
 def notify_screen_captured(timeout: float = 2.0) -> bool:
     """Show notification that screen was captured and being processed by LLM."""
-    return show_notification(
-        _NOTIFICATION_TITLE,
-        _CAPTURE_MESSAGE,
-        timeout=timeout
-    )
+    return _fast_show(_PRESET["captured"], timeout)
 
 
 def notify_event_detected(timeout: float = 3.0) -> bool:
     """Show notification that event was detected and creating appointment."""
-    return show_notification(
-        _NOTIFICATION_TITLE,
-        _EVENT_DETECTED_MESSAGE,
-        timeout=timeout
-    )
+    return _fast_show(_PRESET["event"], timeout)
 
 
 def notify_no_event_detected(timeout: float = 2.5) -> bool:
     """Show notification that no event was detected."""
-    return show_notification(
-        _NOTIFICATION_TITLE,
-        _NO_EVENT_MESSAGE,
-        timeout=timeout
-    )
+    return _fast_show(_PRESET["no_event"], timeout)
 
 
 def notify_calendar_opening(timeout: float = 2.5) -> bool:
     """Show notification that calendar is opening."""
-    return show_notification(
-        _NOTIFICATION_TITLE,
-        _CALENDAR_MESSAGE,
-        timeout=timeout
-    )
-
+    return _fast_show(_PRESET["open_cal"], timeout)
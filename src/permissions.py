@@ -1,13 +1,154 @@
 """
 Permissions module for screen recording and notification permission checks.
 Implements one-shot permission checking with caching.
+
+Results are also persisted next to the settings file, so later launches skip
+the live checks until the TCC database changes (or a day passes when its
+modification time can't be read). A persisted screen recording denial is not
+trusted: the prompt-free preflight runs again so a grant made in System
+Settings is picked up on the next launch.
 """
 
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
 from src.logging_helper import Log
+from src.settings_manager import SETTINGS_DIR, _ensure_settings_dir
 
 # Module-level cache for permission status
 _permission_cache = None
 _notification_permission_cache = None
+# time.monotonic() of the last notification check; denials are re-checked after a TTL
+_notification_checked_at = 0.0
+_NOTIFICATION_DENIED_TTL_SECONDS = 60
+# Cache hits are routine; only format a message for them when debug logging is on
+_LOG_CACHE_HITS = Log.is_enabled("debug")
+# Serialises the live checks so concurrent first calls probe (and prompt) only once
+_cache_lock = threading.Lock()
+
+PERMISSIONS_CACHE_FILE = SETTINGS_DIR / "permissions_cache.json"
+_CACHE_TTL_SECONDS = 24 * 60 * 60
+# Permission grants and revocations are written to these databases
+_OSASCRIPT_PATH = "/usr/bin/osascript"
+_TCC_DB_PATHS = (
+    Path.home() / "Library" / "Application Support" / "com.apple.TCC" / "TCC.db",
+    Path("/Library/Application Support/com.apple.TCC/TCC.db"),
+)
+
+
+def _tcc_mtime():
+    """Return the newest modification time of the readable TCC databases, or None."""
+    mtimes = []
+    for path in _TCC_DB_PATHS:
+        try:
+            mtimes.append(path.stat().st_mtime)
+        except OSError:
+            continue
+    return max(mtimes) if mtimes else None
+
+
+def _load_persisted_cache():
+    """Populate the module caches from the persisted file if it is still fresh."""
+    global _permission_cache, _notification_permission_cache, _notification_checked_at
+
+    try:
+        data = json.loads(PERMISSIONS_CACHE_FILE.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return
+    except Exception as err:
+        Log.warn(f"Failed to read permissions cache ({PERMISSIONS_CACHE_FILE}): {err}")
+        return
+    if not isinstance(data, dict):
+        return
+
+    tcc_mtime = _tcc_mtime()
+    if data.get("tcc_mtime") != tcc_mtime:
+        return
+    if tcc_mtime is None:
+        checked_at = data.get("checked_at")
+        if not isinstance(checked_at, (int, float)) or time.time() - checked_at > _CACHE_TTL_SECONDS:
+            return
+
+    # Only a grant skips the live check; a denial is re-checked via preflight
+    if data.get("screen_recording") is True:
+        _permission_cache = True
+    notifications = data.get("notifications")
+    if isinstance(notifications, bool):
+        _notification_permission_cache = notifications
+        _notification_checked_at = time.monotonic()
+
+
+def _persist_cache():
+    """Write the current module caches, keyed by the TCC database mtime."""
+    _ensure_settings_dir()
+    data = {
+        "checked_at": time.time(),
+        "tcc_mtime": _tcc_mtime(),
+        "screen_recording": _permission_cache,
+        "notifications": _notification_permission_cache,
+    }
+    # Write to a temporary file and swap it in so a crash can't truncate the cache
+    tmp_file = PERMISSIONS_CACHE_FILE.with_suffix(".json.tmp")
+    try:
+        tmp_file.write_text(
+            json.dumps(data, indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
+        os.replace(tmp_file, PERMISSIONS_CACHE_FILE)
+    except Exception as err:
+        Log.warn(f"Failed to write permissions cache ({PERMISSIONS_CACHE_FILE}): {err}")
+
+
+def _preflight_screen_capture():
+    """Ask TCC whether capture is already allowed, without prompting (macOS 10.15+).
+
+    Returns None when the preflight API isn't available.
+    """
+    try:
+        from Quartz import CGPreflightScreenCaptureAccess
+    except ImportError:
+        return None
+    try:
+        return bool(CGPreflightScreenCaptureAccess())
+    except Exception:
+        return False
+
+
+def _request_screen_capture():
+    """Show the system screen recording prompt (first time only) and return access."""
+    try:
+        from Quartz import CGRequestScreenCaptureAccess
+        return bool(CGRequestScreenCaptureAccess())
+    except Exception as err:
+        Log.warn(f"CGRequestScreenCaptureAccess failed: {err}")
+        return False
+
+
+def _probe_screen_capture():
+    """Capture a 1x1 region of the screen; returns False if nothing came back."""
+    try:
+        from Quartz import (
+            CGRectMake,
+            CGWindowListCreateImage,
+            kCGNullWindowID,
+            kCGWindowImageDefault,
+            kCGWindowListOptionOnScreenOnly,
+        )
+    except ImportError:
+        import pyautogui  # deferred: only needed for this one-time check
+        pyautogui.screenshot(region=(0, 0, 1, 1))
+        return True
+
+    image = CGWindowListCreateImage(
+        CGRectMake(0, 0, 1, 1),
+        kCGWindowListOptionOnScreenOnly,
+        kCGNullWindowID,
+        kCGWindowImageDefault,
+    )
+    return image is not None
 
 
 def ensure_screen_recording():
@@ -15,52 +156,113 @@ def ensure_screen_recording():
     Ensures screen recording permission is granted.
     Checks ONCE at startup and caches result.
     
+    CGPreflightScreenCaptureAccess answers without prompting. When it reports
+    no access, CGRequestScreenCaptureAccess shows the system prompt and its
+    answer is cached. Only when the preflight API is unavailable is a 1x1
+    image of the screen grabbed instead: that probe calls Quartz directly so
+    no pixels are decoded, and pyautogui (which pulls in PIL) is only a
+    fallback when the Quartz bindings are missing. A fresh persisted grant
+    skips all of this.
+    
     Returns:
         bool: True if permission granted, False if denied
     """
-    global _permission_cache
-    
     # Check cache first - if already checked, return cached value
     if _permission_cache is not None:
-        Log.info(f"Permission cache hit: {_permission_cache}")
+        if _LOG_CACHE_HITS:
+            Log.debug(f"Permission cache hit: {_permission_cache}")
         return _permission_cache
     
+    with _cache_lock:
+        # Another thread may have completed the check while we waited
+        if _permission_cache is not None:
+            return _permission_cache
+        return _check_screen_recording()
+
+
+def _check_screen_recording():
+    """Run the live screen recording check. Caller holds _cache_lock."""
+    global _permission_cache
+    
     # Only check ONCE - attempt screenshot
     Log.section("Screen Recording Permissions")
     Log.info("Checking screen recording permission (one-time check)")
     
+    preflight = _preflight_screen_capture()
+    # Already granted: no need to grab the screen at all
+    if preflight:
+        _permission_cache = True
+        Log.info("Screen recording permission granted (preflight)")
+        Log.kv(stage="permissions", result="granted")
+        _persist_cache()
+        return True
+    
+    if preflight is False:
+        # Preflight is authoritative; on 10.15+ an image probe would succeed
+        # (wallpaper only) even without access, so ask TCC directly instead
+        _permission_cache = _request_screen_capture()
+        if _permission_cache:
+            Log.info("Screen recording permission granted")
+            Log.kv(stage="permissions", result="granted")
+        else:
+            Log.warn("permission_denied")
+            Log.kv(stage="permissions", result="denied", error="preflight_denied")
+        _persist_cache()
+        return _permission_cache
+    
     try:
         # This will trigger system dialog if permission not granted
-        import pyautogui
-        test_image = pyautogui.screenshot(region=(0, 0, 1, 1))
+        if not _probe_screen_capture():
+            raise RuntimeError("CGWindowListCreateImage returned no image")
         _permission_cache = True
         Log.info("Screen recording permission granted")
-        Log.kv({"stage": "permissions", "result": "granted"})
+        Log.kv(stage="permissions", result="granted")
     except Exception as e:
         _permission_cache = False
         Log.warn("permission_denied")
-        Log.kv({"stage": "permissions", "result": "denied", "error": str(e)})
+        Log.kv(stage="permissions", result="denied", error=str(e))
     
+    _persist_cache()
     return _permission_cache
 
 
 def ensure_notification_permission():
     """
     Ensures notification permission is granted.
-    Checks ONCE at startup and caches result.
+    Checks ONCE at startup and caches result. A denial is only trusted for
+    _NOTIFICATION_DENIED_TTL_SECONDS, since the user can grant access in
+    System Settings at any time.
     Uses osascript which typically works without explicit permission for Python scripts.
     Also tries UserNotifications framework to request permission if needed.
     
     Returns:
         bool: True if notification can be sent, False if definitely denied
     """
-    global _notification_permission_cache
-    
-    # Check cache first - if already checked, return cached value
-    if _notification_permission_cache is not None:
-        Log.info(f"Notification permission cache hit: {_notification_permission_cache}")
+    # Check cache first - grants are kept for the process lifetime, denials expire
+    if _notification_cache_fresh():
+        if _LOG_CACHE_HITS:
+            Log.debug(f"Notification permission cache hit: {_notification_permission_cache}")
         return _notification_permission_cache
     
+    with _cache_lock:
+        # Another thread may have completed the check while we waited
+        if _notification_cache_fresh():
+            return _notification_permission_cache
+        return _check_notification_permission()
+
+
+def _notification_cache_fresh():
+    if _notification_permission_cache is None:
+        return False
+    return _notification_permission_cache or (
+        time.monotonic() - _notification_checked_at < _NOTIFICATION_DENIED_TTL_SECONDS
+    )
+
+
+def _check_notification_permission():
+    """Run the live notification permission check. Caller holds _cache_lock."""
+    global _notification_permission_cache, _notification_checked_at
+    
     # Only check ONCE - mark as enabled without triggering visible notifications
     Log.section("Notification Permissions")
     Log.info("Checking notification permission (one-time check)")
@@ -68,25 +270,15 @@ def ensure_notification_permission():
     # For Python menu bar apps, osascript notifications typically work
     # Let's test if we can send a notification via osascript
     try:
-        import subprocess
-        import time
-        
-        # Instead of displaying a notification, verify that osascript is available
-        process = subprocess.Popen(
-            ['osascript', '-e', 'return "ready"'],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-        stdout, stderr = process.communicate()
-        
-        if process.returncode == 0 and stdout.strip() == b"ready":
+        # Instead of displaying a notification (or spawning osascript), verify
+        # that the osascript binary is present and executable
+        if os.path.isfile(_OSASCRIPT_PATH) and os.access(_OSASCRIPT_PATH, os.X_OK):
             _notification_permission_cache = True
             Log.info("osascript available; assuming notification permission ready")
-            Log.kv({"stage": "notification_permissions", "result": "osascript_available"})
+            Log.kv(stage="notification_permissions", result="osascript_available")
         else:
-            # osascript failed - try UserNotifications framework as fallback
-            error_msg = stderr.decode() if stderr else "unknown error"
-            Log.info(f"osascript test returned non-zero, trying UserNotifications framework: {error_msg}")
+            # osascript missing - try UserNotifications framework as fallback
+            Log.info(f"{_OSASCRIPT_PATH} not executable, trying UserNotifications framework")
             
             # Try UserNotifications framework to request permission
             try:
@@ -104,8 +296,9 @@ def ensure_notification_permission():
                     UNAuthorizationOptionBadge
                 )
                 
-                # Use a simple synchronous approach with timeout
+                # Block until the completion handler signals, with a timeout
                 permission_granted = None
+                answered = threading.Event()
                 
                 def auth_callback(granted, error):
                     nonlocal permission_granted
@@ -118,44 +311,45 @@ def ensure_notification_permission():
                     else:
                         permission_granted = False
                         Log.warn("Notification permission denied via UserNotifications")
+                    answered.set()
                 
                 Log.info("Requesting notification permission via UserNotifications framework...")
                 notification_center.requestAuthorizationWithOptions_completionHandler_(options, auth_callback)
-                
-                # Wait for async callback (with timeout)
-                wait_time = 0
-                while permission_granted is None and wait_time < 3:
-                    time.sleep(0.1)
-                    wait_time += 0.1
+                answered.wait(3.0)
                 
                 if permission_granted is True:
                     _notification_permission_cache = True
-                    Log.kv({"stage": "notification_permissions", "result": "granted_via_usernotifications"})
+                    Log.kv(stage="notification_permissions", result="granted_via_usernotifications")
                 elif permission_granted is False:
                     _notification_permission_cache = False
-                    Log.kv({"stage": "notification_permissions", "result": "denied"})
+                    Log.kv(stage="notification_permissions", result="denied")
                 else:
                     # Timeout or unclear - assume allowed (osascript might still work)
                     _notification_permission_cache = True
                     Log.info("Notification permission request timeout - assuming allowed (osascript may work)")
-                    Log.kv({"stage": "notification_permissions", "result": "timeout_assumed_allowed"})
+                    Log.kv(stage="notification_permissions", result="timeout_assumed_allowed")
                     
             except ImportError:
                 # UserNotifications not available - assume allowed (osascript typically works)
                 _notification_permission_cache = True
                 Log.info("UserNotifications framework not available - assuming allowed (osascript notifications)")
-                Log.kv({"stage": "notification_permissions", "result": "assumed_allowed_no_usernotifications"})
+                Log.kv(stage="notification_permissions", result="assumed_allowed_no_usernotifications")
             except Exception as e:
                 # Error with UserNotifications - assume allowed
                 _notification_permission_cache = True
                 Log.warn(f"UserNotifications framework error: {e} - assuming allowed")
-                Log.kv({"stage": "notification_permissions", "result": "assumed_allowed", "error": str(e)})
+                Log.kv(stage="notification_permissions", result="assumed_allowed", error=str(e))
         
     except Exception as e:
         Log.warn(f"Notification permission check failed: {e}")
         # Default to True - osascript notifications typically work without explicit permission
         _notification_permission_cache = True
-        Log.kv({"stage": "notification_permissions", "result": "assumed_allowed", "error": str(e)})
+        Log.kv(stage="notification_permissions", result="assumed_allowed", error=str(e))
     
+    _notification_checked_at = time.monotonic()
+    _persist_cache()
     return _notification_permission_cache
 
+
+_load_persisted_cache()
+
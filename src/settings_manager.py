@@ -9,18 +9,49 @@ choice survives across app restarts.
 from __future__ import annotations
 
 import json
+import os
+from dataclasses import asdict, dataclass, fields, replace
 from pathlib import Path
-from typing import Dict, Literal, Optional, TypedDict
+from typing import Dict, Literal, Optional, Tuple
 
 from src.logging_helper import Log
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj: Dict[str, object]) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> object:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 CalendarPreference = Literal["apple", "google"]
+_VALID_CALENDARS = frozenset(("apple", "google"))
 
 
-class SettingsSchema(TypedDict, total=False):
+@dataclass(frozen=True)
+class Settings:
+    """
+    Immutable snapshot of the user's settings.
+    Slotted so each instance is a fixed-size record rather than a dict.
+    """
+    __slots__ = ("preferred_calendar",)
+
     preferred_calendar: CalendarPreference
 
 
+_SETTINGS_FIELDS = frozenset(f.name for f in fields(Settings))
+
+
 SETTINGS_DIR = (
     Path.home()
     / "Library"
@@ -29,71 +60,101 @@ SETTINGS_DIR = (
 )
 SETTINGS_FILE = SETTINGS_DIR / "settings.json"
 
-DEFAULT_SETTINGS: SettingsSchema = {
-    "preferred_calendar": "apple",
-}
+DEFAULT_SETTINGS = Settings(preferred_calendar="apple")
+
+# (st_mtime_ns of SETTINGS_FILE, merged settings); 0 means "file missing"
+_settings_cache: Optional[Tuple[int, Settings]] = None
+
+
+_dir_ready = False
 
 
 def _ensure_settings_dir() -> None:
+    # mkdir once per process; a failure leaves the flag unset so the next call retries
+    global _dir_ready
+    if _dir_ready:
+        return
     try:
         SETTINGS_DIR.mkdir(parents=True, exist_ok=True)
+        _dir_ready = True
     except Exception as err:
         Log.warn(f"Unable to create settings directory {SETTINGS_DIR}: {err}")
 
 
-def load_settings() -> SettingsSchema:
+def _settings_mtime() -> int:
+    try:
+        return SETTINGS_FILE.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def load_settings() -> Settings:
     """
     Load settings from disk, falling back to defaults if anything fails.
+
+    The parsed result is memoized and only re-read when the file's mtime changes.
     """
+    global _settings_cache
+    mtime = _settings_mtime()
+    if _settings_cache is not None and _settings_cache[0] == mtime:
+        return _settings_cache[1]
+
     _ensure_settings_dir()
-    if not SETTINGS_FILE.exists():
+    if not mtime:
         Log.info(f"Settings file not found, using defaults: {SETTINGS_FILE}")
-        return DEFAULT_SETTINGS.copy()
+        _settings_cache = (0, DEFAULT_SETTINGS)
+        return DEFAULT_SETTINGS
 
     try:
-        data = json.loads(SETTINGS_FILE.read_text(encoding="utf-8"))
+        data = _loads(SETTINGS_FILE.read_bytes())
         if not isinstance(data, dict):
             raise ValueError("Settings data is not a JSON object")
     except Exception as err:
         Log.warn(f"Failed to read settings file ({SETTINGS_FILE}): {err}")
-        return DEFAULT_SETTINGS.copy()
+        return DEFAULT_SETTINGS
 
-    merged: SettingsSchema = DEFAULT_SETTINGS.copy()
     # Merge only known keys
-    for key in DEFAULT_SETTINGS:
-        if key in data:
-            merged[key] = data[key]  # type: ignore[assignment]
+    merged = replace(
+        DEFAULT_SETTINGS,
+        **{key: value for key, value in data.items() if key in _SETTINGS_FIELDS},
+    )
+    _settings_cache = (mtime, merged)
     return merged
 
 
-def save_settings(settings: SettingsSchema) -> None:
+def save_settings(settings: Settings) -> None:
     """
     Persist settings to disk.
+
+    Writes to a temporary file and swaps it in, so a crash mid-write never
+    leaves a truncated settings.json behind.
     """
+    global _settings_cache
     _ensure_settings_dir()
+    tmp_file = SETTINGS_FILE.with_suffix(".json.tmp")
     try:
-        SETTINGS_FILE.write_text(
-            json.dumps(settings, indent=2, sort_keys=True),
-            encoding="utf-8",
-        )
+        tmp_file.write_bytes(_dumps(asdict(settings)))
+        os.replace(tmp_file, SETTINGS_FILE)
     except Exception as err:
         Log.warn(f"Failed to write settings file ({SETTINGS_FILE}): {err}")
+        _settings_cache = None
+        return
+    _settings_cache = (_settings_mtime(), settings)
 
 
 def get_preferred_calendar() -> CalendarPreference:
-    settings = load_settings()
-    preferred = settings.get("preferred_calendar", DEFAULT_SETTINGS["preferred_calendar"])
-    if preferred not in ("apple", "google"):
+    preferred = load_settings().preferred_calendar
+    if preferred not in _VALID_CALENDARS:
         Log.warn(f"Invalid preferred_calendar value '{preferred}', defaulting to apple")
         preferred = "apple"
     return preferred
 
 
 def set_preferred_calendar(value: CalendarPreference) -> None:
-    if value not in ("apple", "google"):
+    if value not in _VALID_CALENDARS:
         raise ValueError(f"Invalid calendar preference: {value}")
-    settings = load_settings()
-    settings["preferred_calendar"] = value
-    save_settings(settings)
+    # The whole file is rewritten, so start from what we already have in memory
+    current = _settings_cache[1] if _settings_cache is not None else DEFAULT_SETTINGS
+    save_settings(replace(current, preferred_calendar=value))
     Log.info(f"Saved preferred calendar setting: {value}")
 
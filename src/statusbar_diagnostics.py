@@ -0,0 +1,262 @@
+"""
+Diagnostics for the rumps status item (menu bar icon).
+
+Only imported when the rumps_diagnostics environment variable is set, so the
+normal startup path never loads or compiles any of this.
+"""
+
+import traceback
+from operator import attrgetter
+
+from src.logging_helper import Log
+
+try:
+    import objc
+    from AppKit import NSApplication
+    APPKIT_AVAILABLE = True
+    # What a probe of a missing attribute or a failing bridged call raises
+    _PROBE_ERRORS = (AttributeError, objc.error)
+except ImportError:
+    APPKIT_AVAILABLE = False
+    _PROBE_ERRORS = (AttributeError,)
+
+_MISSING = object()
+
+# NSApplication.sharedApplication() and its delegate, fetched across the bridge once
+_shared_app = None
+_app_delegate_cache = None
+
+# The attribute dumps are only built (dir() included) when debug logging is on
+_DEBUG = Log.is_enabled("debug")
+# Info lines that need extra bridge calls (class names, button title) are skipped otherwise
+_INFO = Log.is_enabled("info")
+
+# rumps.App attributes dumped by log_rumps_state
+_STATE_ATTRS = ('_icon', 'icon', '_template', 'title', '_name', 'name')
+
+# Attribute paths (from the rumps.App instance) where the NSStatusItem has been
+# kept across rumps versions, most likely first
+_CANDIDATE_PATHS = (
+    '_nsapp.nsstatusitem',
+    '_nsapp.statusItem',
+    '_nsapp._statusitem',
+    '_nsstatusitem',
+    'nsstatusitem',
+    '_statusItem',
+    'statusItem',
+    'status_item',
+    '_status_item',
+    '_menu._status_item',
+)
+# (getter, path) pairs; attrgetter walks a dotted path in C
+_CANDIDATE_GETTERS = tuple((attrgetter(path), path) for path in _CANDIDATE_PATHS)
+
+
+def _warn_exception(message, err):
+    """Log a warning for err, with the traceback only at debug level."""
+    if not Log.is_enabled("warn"):
+        return
+    Log.warn(f"{message}: {err}")
+    if _DEBUG:
+        Log.warn(f"Traceback: {traceback.format_exc()}")
+
+
+def _find_status_item(controller):
+    """Return (status_item, dotted path) for the first candidate path that resolves."""
+    for getter, path in _CANDIDATE_GETTERS:
+        try:
+            candidate = getter(controller)
+        except _PROBE_ERRORS:
+            continue
+        if candidate is not None:
+            return candidate, path
+    return None, None
+
+
+def _app_delegate():
+    """Return the NSApplication delegate, caching both objects once available."""
+    global _shared_app, _app_delegate_cache
+    if _app_delegate_cache is not None:
+        return _app_delegate_cache
+    if _shared_app is None:
+        _shared_app = NSApplication.sharedApplication()
+    # The delegate is only set once app.run() starts, so a None is not cached
+    _app_delegate_cache = _shared_app.delegate()
+    return _app_delegate_cache
+
+
+def _delegate_status_item():
+    """Return the status item held by the NSApplication delegate, if any."""
+    delegate = _app_delegate()
+    if delegate is None:
+        return None
+    return getattr(delegate, 'nsstatusitem', None)
+
+
+def check_status_item_creation(controller):
+    """Check if rumps created the status item and log detailed diagnostic info.
+
+    According to rumps source code, the status item is stored in:
+    controller._nsapp.nsstatusitem (where _nsapp is the NSApp delegate instance)
+    """
+    if not APPKIT_AVAILABLE:
+        Log.warn("AppKit not available - cannot check status item creation")
+        return
+
+    # Drain the bridged objects created here right away; during __init__ no
+    # run loop (and so no outer autorelease pool) is active yet
+    with objc.autorelease_pool():
+        try:
+            if _DEBUG:
+                # List what rumps actually created, bucketed in a single pass:
+                # status/item/ns-related names, and rumps internals (underscore prefix)
+                attr_count = 0
+                status_related = []
+                rumps_internals = []
+                for attr in dir(controller):
+                    if attr.startswith('__'):
+                        continue
+                    attr_count += 1
+                    lowered = attr.lower()
+                    if 'status' in lowered or 'item' in lowered or 'ns' in lowered:
+                        status_related.append(attr)
+                    if attr[0] == '_' and len(rumps_internals) < 20:
+                        rumps_internals.append(attr)
+                Log.debug(f"All attributes on rumps.App instance: {attr_count} total")
+                if status_related:
+                    Log.debug(f"Status/item related attributes: {status_related}")
+                Log.debug(f"Private/internal attributes (first 20): {rumps_internals}")
+
+            # Known locations first; rumps keeps it at controller._nsapp.nsstatusitem
+            status_item, found_attr = _find_status_item(controller)
+            nsapp = getattr(controller, '_nsapp', _MISSING)
+            if status_item is not None:
+                Log.info(f"✓ Found status item at controller.{found_attr}")
+            elif nsapp is not _MISSING:
+                if _INFO:
+                    Log.info(f"Found _nsapp: {type(nsapp).__name__}")
+                Log.info("  _nsapp.nsstatusitem not set yet (will be created when app.run() starts)")
+                if _DEBUG:
+                    nsapp_attrs = []
+                    status_attrs = []
+                    for attr in dir(nsapp):
+                        if attr.startswith('__'):
+                            continue
+                        if len(nsapp_attrs) < 10:
+                            nsapp_attrs.append(attr)
+                        lowered = attr.lower()
+                        if 'status' in lowered or 'item' in lowered:
+                            status_attrs.append(attr)
+                    if status_attrs:
+                        Log.debug(f"  _nsapp attributes with 'status' or 'item': {status_attrs}")
+                    Log.debug(f"  _nsapp attributes (first 10): {nsapp_attrs}")
+            else:
+                Log.info("  controller._nsapp doesn't exist yet")
+
+            # rumps also hangs it off the NSApplication delegate once the app is running
+            if status_item is None:
+                Log.info("Trying to access status item through NSApplication...")
+                try:
+                    status_item = _delegate_status_item()
+                    if status_item is not None:
+                        found_attr = 'NSApplication.delegate().nsstatusitem'
+                        Log.info("✓ Found status item through NSApplication delegate.nsstatusitem")
+                    else:
+                        Log.info("  NSApplication delegate has no status item yet (set when app.run() starts)")
+                except _PROBE_ERRORS as e:
+                    _warn_exception("Error accessing through NSApplication", e)
+
+            # Check visibility if we found the status item
+            if status_item:
+                check_status_item_visibility(status_item, found_attr)
+            else:
+                Log.info("Status item not found during __init__ (this is expected - it's created when app.run() starts)")
+                Log.info("Will check again after app starts running (on first menu interaction)")
+
+        except Exception as e:
+            _warn_exception("Error checking status item creation", e)
+
+
+def check_status_item_creation_after_start(controller):
+    """Check status item after app.run() has started (when it should be created)."""
+    if not APPKIT_AVAILABLE:
+        Log.warn("AppKit not available - cannot check status item creation")
+        return
+
+    with objc.autorelease_pool():
+        try:
+            # Known locations first (rumps stores it at _nsapp.nsstatusitem)
+            status_item, found_attr = _find_status_item(controller)
+            if status_item is not None:
+                Log.info(f"✓ Found status item at controller.{found_attr}")
+            else:
+                Log.warn("  No status item at any known controller attribute")
+
+            # Also try NSApplication delegate
+            if not status_item:
+                try:
+                    status_item = _delegate_status_item()
+                    if status_item:
+                        found_attr = 'NSApplication.delegate().nsstatusitem'
+                        Log.info("✓ Found status item through NSApplication delegate.nsstatusitem")
+                except _PROBE_ERRORS as e:
+                    Log.warn(f"Error accessing through NSApplication: {e}")
+
+            if status_item:
+                check_status_item_visibility(status_item, found_attr)
+            else:
+                Log.warn("⚠️  Could not find status item even after app.run() started")
+                Log.warn("This could indicate a rumps bug or menu bar space issue")
+        except Exception as e:
+            _warn_exception("Error checking status item after start", e)
+
+
+def log_rumps_state(controller):
+    """Log the rumps version and app state; meant to run once app.run() has started."""
+    # Check if rumps has any error state or initialization flags
+    if _DEBUG:
+        for attr_name in _STATE_ATTRS:
+            value = getattr(controller, attr_name, _MISSING)
+            if value is not _MISSING:
+                Log.debug(f"rumps.{attr_name} value: {value}")
+
+    # Try to check rumps version and see if there's a known issue
+    try:
+        import rumps
+        Log.info(f"rumps version: {getattr(rumps, '__version__', 'unknown')}")
+    except ImportError:
+        pass
+
+
+def check_status_item_visibility(status_item, found_attr):
+    """Check if the status item button is visible and log its properties."""
+    try:
+        button = status_item.button()
+        if button:
+            frame = button.frame()
+            # Read the struct fields once rather than re-walking frame.size per use
+            width, height = frame.size.width, frame.size.height
+            is_visible = width > 0 and height > 0
+            if _INFO:
+                origin = frame.origin
+                Log.info(f"Status item button frame: ({origin.x:.0f}, {origin.y:.0f}, {width:.0f}x{height:.0f}), visible={is_visible}")
+
+                # Get button title to confirm it's our item
+                try:
+                    title = button.title()
+                    Log.info(f"Status item button title: '{title}'")
+                except _PROBE_ERRORS:
+                    pass
+
+            if not is_visible:
+                Log.warn("⚠️  Status item has zero size - menu bar item is hidden (likely space issue)")
+                return False
+            else:
+                Log.info("✓ Status item created and has valid size - should be visible")
+                return True
+        else:
+            Log.warn("⚠️  Status item button is None")
+            return False
+    except Exception as e:
+        _warn_exception("Error checking status item visibility", e)
+        return False